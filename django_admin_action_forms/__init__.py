@@ -1,4 +1,13 @@
 from .admin import AdminActionFormsMixin
+from .autocomplete import AutocompleteLabel
+from .counts import CappedCount, CountStrategy, EstimatedCount, ExactCount
 from .decorators import action_with_form
 from .forms import ActionForm, AdminActionForm, InlineActionForm, InlineAdminActionForm
 from .formsets import StackedAdminActionInline, TabularAdminActionInline
+from .locks import (
+    CacheLockBackend,
+    DatabaseAdvisoryLockBackend,
+    FileLockBackend,
+    LockBackend,
+)
+from .tasks import ActionExecutor, ActionTask, ThreadPoolActionExecutor
@@ -12,19 +12,61 @@ from django.http import HttpRequest
 from django.template.response import TemplateResponse
 from django.urls import path
 
-from .views import ActionFormAutocompleteJsonView
+from .views import (
+    ActionFormAutocompleteJsonView,
+    ActionFormCheckpointResumeView,
+    ActionFormObjectsJsonView,
+    ActionFormTaskProgressJsonView,
+    ActionFormTaskView,
+)
 
 
 class AdminActionFormsMixin:
+    action_form_autocomplete_view_class: "type[ActionFormAutocompleteJsonView]" = (
+        ActionFormAutocompleteJsonView
+    )
+
     @override
     def get_urls(self):
         return [
             path(
                 "action-form-autocomplete/",
-                ActionFormAutocompleteJsonView.as_view(model_admin=self),
+                self.action_form_autocomplete_view_class.as_view(model_admin=self),
                 name="%s_%s_action_form_autocomplete"
                 % (self.opts.app_label, self.opts.model_name),
             ),
+            path(
+                "action-form-autocomplete-batch/",
+                self.action_form_autocomplete_view_class.as_view(
+                    model_admin=self, batch=True
+                ),
+                name="%s_%s_action_form_autocomplete_batch"
+                % (self.opts.app_label, self.opts.model_name),
+            ),
+            path(
+                "action-form-objects/",
+                ActionFormObjectsJsonView.as_view(model_admin=self),
+                name="%s_%s_action_form_objects"
+                % (self.opts.app_label, self.opts.model_name),
+            ),
+            path(
+                "action-form-task/<str:task_id>/",
+                ActionFormTaskView.as_view(model_admin=self),
+                name="%s_%s_action_form_task"
+                % (self.opts.app_label, self.opts.model_name),
+            ),
+            path(
+                "action-form-task/<str:task_id>/progress/",
+                ActionFormTaskProgressJsonView.as_view(model_admin=self),
+                name="%s_%s_action_form_task_progress"
+                % (self.opts.app_label, self.opts.model_name),
+            ),
+            path(
+                "action-form-checkpoint-resume/",
+                ActionFormCheckpointResumeView.as_view(model_admin=self),
+                name="%s_%s_action_form_checkpoint_resume"
+                % (self.opts.app_label, self.opts.model_name),
+            ),
         ] + super().get_urls()
 
     @override
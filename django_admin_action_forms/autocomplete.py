@@ -0,0 +1,315 @@
+from typing import Any
+
+import asyncio
+import binascii
+import datetime
+import hashlib
+import json
+import time
+from collections.abc import Awaitable, Callable
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+# Django 4.0.x and above
+try:
+    from django.contrib.admin.utils import lookup_spawns_duplicates
+# Backwards compatibility for Django 3.2.x
+except ImportError:
+    from django.contrib.admin.utils import (
+        lookup_needs_distinct as lookup_spawns_duplicates,
+    )
+
+
+class AutocompleteResultsCache:
+    """
+    Cache of autocomplete results stored in the default cache for `timeout` seconds.
+
+    Each key is mapped to one of `max_entries` slots, so the number of entries stored in `namespace` is bounded.
+    Concurrent requests for the same missing key wait for the first of them to compute the results,
+    so the search query runs only once.
+    """
+
+    cache_key_prefix: str = "django_admin_action_forms.autocomplete"
+    lock_timeout: int = 10
+    wait_interval: float = 0.05
+
+    def __init__(self, namespace: str, timeout: int, max_entries: int = 1000):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.max_entries = max_entries
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _get_slot_key(self, key: str) -> str:
+        slot = int(self._hash(key), 16) % self.max_entries
+        return f"{self.cache_key_prefix}.{self.namespace}.{slot}"
+
+    def _get_lock_key(self, key: str) -> str:
+        return f"{self.cache_key_prefix}.{self.namespace}.lock.{self._hash(key)}"
+
+    def get(self, key: str) -> "Any | None":
+        stored = cache.get(self._get_slot_key(key))
+
+        # Slot might be used by another key
+        if stored is None or stored[0] != key:
+            return None
+
+        return stored[1]
+
+    def set(self, key: str, value: Any) -> None:
+        cache.set(self._get_slot_key(key), (key, value), self.timeout)
+
+    def get_or_set(self, key: str, compute: "Callable[[], Any]") -> Any:
+        value = self.get(key)
+
+        if value is not None:
+            return value
+
+        lock_key = self._get_lock_key(key)
+        lock_acquired = cache.add(lock_key, True, self.lock_timeout)
+
+        if not lock_acquired:
+            deadline = time.monotonic() + self.lock_timeout
+
+            while time.monotonic() < deadline:
+                time.sleep(self.wait_interval)
+
+                value = self.get(key)
+                if value is not None:
+                    return value
+
+                # Request computing the results failed, so they are computed again
+                if cache.get(lock_key) is None:
+                    break
+
+        try:
+            value = compute()
+            self.set(key, value)
+        finally:
+            if lock_acquired:
+                cache.delete(lock_key)
+
+        return value
+
+    async def aget_or_set(
+        self, key: str, compute: "Callable[[], Awaitable[Any]]"
+    ) -> Any:
+        stored = await cache.aget(self._get_slot_key(key))
+
+        if stored is not None and stored[0] == key:
+            return stored[1]
+
+        lock_key = self._get_lock_key(key)
+        lock_acquired = await cache.aadd(lock_key, True, self.lock_timeout)
+
+        if not lock_acquired:
+            deadline = time.monotonic() + self.lock_timeout
+
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.wait_interval)
+
+                stored = await cache.aget(self._get_slot_key(key))
+                if stored is not None and stored[0] == key:
+                    return stored[1]
+
+                if await cache.aget(lock_key) is None:
+                    break
+
+        try:
+            value = await compute()
+            await cache.aset(self._get_slot_key(key), (key, value), self.timeout)
+        finally:
+            if lock_acquired:
+                await cache.adelete(lock_key)
+
+        return value
+
+
+class AutocompleteLabel:
+    """
+    Label of objects in autocomplete fields, created from values of `fields` instead of `str(obj)`,
+    so that only these columns are fetched from the database.
+
+    `label` is either a format string, e.g. `"{first_name} {last_name}"`, or a callable receiving a dictionary of values.
+    """
+
+    def __init__(
+        self,
+        fields: "list[str]",
+        label: "str | Callable[[dict[str, Any]], str]",
+    ):
+        self.fields = fields
+        self.label = label
+
+    def get_values(self, queryset: QuerySet, *extra_fields: str) -> QuerySet:
+        return queryset.values(*dict.fromkeys(["pk", *self.fields, *extra_fields]))
+
+    def get_label(self, values: "dict[str, Any]") -> str:
+        if callable(self.label):
+            return str(self.label(values))
+        return self.label.format(**values)
+
+
+def get_search_results(
+    request: HttpRequest,
+    queryset: QuerySet,
+    term: str,
+    search_fields: "list[str] | Callable[[HttpRequest, QuerySet, str], QuerySet]",
+) -> "tuple[QuerySet, bool]":
+    """
+    Filters the queryset using lookups from `search_fields`, e.g. `"name__istartswith"` or `"pk"`,
+    which are joined using `OR` and receive the whole search term. Lookups the term is not valid for,
+    e.g. `"pk"` with non-numeric term, are skipped.
+
+    If `search_fields` is a callable, it is called with the request, the queryset and the search term instead.
+    Returns the filtered queryset and whether it may contain duplicates, like `ModelAdmin.get_search_results()`.
+    """
+    if callable(search_fields):
+        return search_fields(request, queryset, term), False
+
+    if not term:
+        return queryset, False
+
+    condition = Q()
+    may_have_duplicates = False
+
+    for lookup in search_fields:
+        try:
+            # Values are validated when the filter is added, without running any query
+            queryset.filter(**{lookup: term})
+        except (ValueError, TypeError, ValidationError):
+            continue
+
+        condition |= Q(**{lookup: term})
+        may_have_duplicates |= lookup_spawns_duplicates(queryset.model._meta, lookup)
+
+    # None of the lookups accepts the term
+    if not condition:
+        return queryset.none(), False
+
+    return queryset.filter(condition), may_have_duplicates
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def get_keyset_ordering(queryset: QuerySet) -> "list[tuple[str, bool]] | None":
+    """
+    Returns names of fields the queryset is ordered by, with `True` for descending order, ending with the primary key.
+
+    Returns `None` if keyset pagination cannot be used with the ordering, e.g. because it contains expressions,
+    nullable fields or fields of related models.
+    """
+    opts = queryset.model._meta
+
+    if queryset.query.extra_order_by:
+        return None
+
+    if queryset.query.order_by:
+        order_by = queryset.query.order_by
+    elif queryset.query.default_ordering and opts.ordering:
+        order_by = opts.ordering
+    else:
+        order_by = ["pk"]
+
+    ordering: "list[tuple[str, bool]]" = []
+
+    for item in order_by:
+        if not isinstance(item, str) or item == "?":
+            return None
+
+        name = item.lstrip("-")
+        if name == "pk":
+            name = opts.pk.attname
+
+        try:
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+        # Ordering by a relation uses ordering of the related model
+        if (
+            not field.concrete
+            or field.null
+            or (field.is_relation and name != field.attname)
+        ):
+            return None
+
+        ordering.append((field.attname, item.startswith("-")))
+
+    # Primary key makes the ordering unique
+    if opts.pk.attname not in (name for name, _ in ordering):
+        ordering.append((opts.pk.attname, False))
+
+    return ordering
+
+
+def order_by_keyset(queryset: QuerySet, ordering: "list[tuple[str, bool]]") -> QuerySet:
+    return queryset.order_by(
+        *(f"-{name}" if descending else name for name, descending in ordering)
+    )
+
+
+def filter_after_cursor(
+    queryset: QuerySet, ordering: "list[tuple[str, bool]]", cursor: str
+) -> QuerySet:
+    """
+    Returns objects following the object the cursor was created for, without using `OFFSET`.
+    """
+    opts = queryset.model._meta
+
+    try:
+        values = json.loads(urlsafe_base64_decode(cursor))
+
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise InvalidCursor(cursor)
+
+        values = [
+            opts.get_field(name).to_python(value)
+            for (name, _), value in zip(ordering, values)
+        ]
+    except (binascii.Error, UnicodeDecodeError, ValueError, ValidationError) as error:
+        raise InvalidCursor(cursor) from error
+
+    condition = Q()
+    equal = Q()
+
+    for (name, descending), value in zip(ordering, values):
+        condition |= equal & Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        equal &= Q(**{name: value})
+
+    return queryset.filter(condition)
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Encodes datetimes and times with microseconds, which `DjangoJSONEncoder` truncates to milliseconds,
+    so that objects differing only in microseconds are neither repeated nor skipped when paginating.
+    """
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def get_cursor(
+    obj: "Model | dict[str, Any]", ordering: "list[tuple[str, bool]]"
+) -> str:
+    return urlsafe_base64_encode(
+        json.dumps(
+            [
+                obj[name] if isinstance(obj, dict) else getattr(obj, name)
+                for name, _ in ordering
+            ],
+            cls=CursorJSONEncoder,
+        ).encode()
+    )
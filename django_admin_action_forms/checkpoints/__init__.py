@@ -0,0 +1,341 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from django.contrib.admin import ModelAdmin
+
+import uuid
+from datetime import datetime
+
+# Module `apps` of this package would shadow the registry imported as `apps`
+from django.apps import apps as global_apps
+from django.contrib import messages
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import router
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from ..tasks import (
+    MessagesCollector,
+    get_action_request,
+    get_post_data,
+    get_registered_action,
+    get_registered_modeladmin,
+    get_submitted_action_data,
+)
+
+
+class Checkpoint:
+    """
+    Progress of a long-running action, containing everything needed to resume it:
+    submitted form data, selection of objects and primary key of the last processed object.
+
+    Form data is stored as submitted and validated again when the action is resumed.
+    """
+
+    def __init__(
+        self,
+        admin_site_name: str,
+        app_label: str,
+        model_name: str,
+        action: str,
+        user_pk: Any,
+        post_data: "dict[str, list[str]]",
+        query_string: str = "",
+        last_pk: Any = None,
+        processed: int = 0,
+        checkpoint_id: "str | None" = None,
+        updated_at: "datetime | None" = None,
+    ):
+        self.id = checkpoint_id or uuid.uuid4().hex
+        self.admin_site_name = admin_site_name
+        self.app_label = app_label
+        self.model_name = model_name
+        self.action = action
+        self.user_pk = user_pk
+        self.post_data = post_data
+        self.query_string = query_string
+        self.last_pk = last_pk
+        self.processed = processed
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_request(
+        cls, modeladmin: "ModelAdmin", action: str, request: HttpRequest
+    ) -> "Checkpoint":
+        return cls(
+            admin_site_name=modeladmin.admin_site.name,
+            app_label=modeladmin.opts.app_label,
+            model_name=modeladmin.opts.model_name,
+            action=action,
+            user_pk=request.user.pk,
+            post_data=get_post_data(request),
+            query_string=request.GET.urlencode(),
+        )
+
+    def get_request(self, messages: "MessagesCollector | None" = None) -> HttpRequest:
+        """
+        Returns a request equivalent to the one that submitted the form.
+        """
+        return get_action_request(
+            self.user_pk,
+            messages if messages is not None else MessagesCollector(),
+            self.post_data,
+            self.query_string,
+        )
+
+
+class CheckpointStore:
+    """
+    Base class for stores of checkpoints used by `@action_with_form(checkpoint_store=...)`.
+    """
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        raise NotImplementedError(
+            "Subclasses of CheckpointStore must provide a save() method."
+        )
+
+    def saves_in_transaction(self, using: str) -> bool:
+        """
+        Returns whether checkpoints are saved in transactions of the database `using`, so they can be saved
+        together with the processed chunk. Otherwise they are saved after the chunk is committed.
+        """
+        return False
+
+    def get(self, checkpoint_id: str) -> "Checkpoint | None":
+        raise NotImplementedError(
+            "Subclasses of CheckpointStore must provide a get() method."
+        )
+
+    def delete(self, checkpoint: Checkpoint) -> None:
+        raise NotImplementedError(
+            "Subclasses of CheckpointStore must provide a delete() method."
+        )
+
+    def filter(
+        self,
+        admin_site_name: str,
+        app_label: str,
+        model_name: str,
+        action: str,
+        user_pk: Any,
+    ) -> "list[Checkpoint]":
+        raise NotImplementedError(
+            "Subclasses of CheckpointStore must provide a filter() method."
+        )
+
+
+class DatabaseCheckpointStore(CheckpointStore):
+    """
+    Stores checkpoints using `ActionCheckpoint` model. When the model is stored in the same database
+    as processed objects, checkpoint is saved in the same transaction as the processed chunk.
+
+    Requires adding `django_admin_action_forms.checkpoints` to `INSTALLED_APPS` and running `migrate`.
+    """
+
+    def _get_model(self):
+        if not global_apps.is_installed("django_admin_action_forms.checkpoints"):
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} requires 'django_admin_action_forms.checkpoints' in INSTALLED_APPS."
+            )
+
+        from .models import ActionCheckpoint
+
+        return ActionCheckpoint
+
+    def _to_checkpoint(self, instance) -> Checkpoint:
+        last_pk = instance.last_pk
+        if last_pk is not None:
+            model = global_apps.get_model(instance.app_label, instance.model_name)
+            last_pk = model._meta.pk.to_python(last_pk)
+
+        return Checkpoint(
+            admin_site_name=instance.admin_site_name,
+            app_label=instance.app_label,
+            model_name=instance.model_name,
+            action=instance.action,
+            user_pk=instance.user_id,
+            post_data=instance.post_data,
+            query_string=instance.query_string,
+            last_pk=last_pk,
+            processed=instance.processed,
+            checkpoint_id=instance.pk.hex,
+            updated_at=instance.updated_at,
+        )
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        ActionCheckpoint = self._get_model()
+
+        instance, _ = ActionCheckpoint.objects.update_or_create(
+            pk=checkpoint.id,
+            defaults={
+                "admin_site_name": checkpoint.admin_site_name,
+                "app_label": checkpoint.app_label,
+                "model_name": checkpoint.model_name,
+                "action": checkpoint.action,
+                "user_id": checkpoint.user_pk,
+                "post_data": checkpoint.post_data,
+                "query_string": checkpoint.query_string,
+                "last_pk": (
+                    str(checkpoint.last_pk) if checkpoint.last_pk is not None else None
+                ),
+                "processed": checkpoint.processed,
+            },
+        )
+        checkpoint.updated_at = instance.updated_at
+
+    def saves_in_transaction(self, using: str) -> bool:
+        return router.db_for_write(self._get_model()) == using
+
+    def get(self, checkpoint_id: str) -> "Checkpoint | None":
+        ActionCheckpoint = self._get_model()
+
+        try:
+            return self._to_checkpoint(ActionCheckpoint.objects.get(pk=checkpoint_id))
+        except (ActionCheckpoint.DoesNotExist, ValidationError):
+            return None
+
+    def delete(self, checkpoint: Checkpoint) -> None:
+        ActionCheckpoint = self._get_model()
+
+        ActionCheckpoint.objects.filter(pk=checkpoint.id).delete()
+
+    def filter(
+        self,
+        admin_site_name: str,
+        app_label: str,
+        model_name: str,
+        action: str,
+        user_pk: Any,
+    ) -> "list[Checkpoint]":
+        ActionCheckpoint = self._get_model()
+
+        return [
+            self._to_checkpoint(instance)
+            for instance in ActionCheckpoint.objects.filter(
+                admin_site_name=admin_site_name,
+                app_label=app_label,
+                model_name=model_name,
+                action=action,
+                user_id=user_pk,
+            ).order_by("-updated_at")
+        ]
+
+
+class CacheCheckpointStore(CheckpointStore):
+    """
+    Stores checkpoints in the default cache, which does not require a database table,
+    but checkpoints may expire. As the cache is not transactional, checkpoints are saved after the processed chunk
+    is committed, so an interrupted action may process the last chunk again when resumed.
+    """
+
+    cache_key_prefix: str = "django_admin_action_forms.checkpoint"
+
+    def __init__(self, timeout: "int | None" = 7 * 24 * 60 * 60):
+        self.timeout = timeout
+
+    def _get_key(self, checkpoint_id: str) -> str:
+        return f"{self.cache_key_prefix}.{checkpoint_id}"
+
+    def _get_index_key(
+        self,
+        admin_site_name: str,
+        app_label: str,
+        model_name: str,
+        action: str,
+        user_pk: Any,
+    ) -> str:
+        return f"{self.cache_key_prefix}.index.{admin_site_name}.{app_label}.{model_name}.{action}.{user_pk}"
+
+    def _get_checkpoint_index_key(self, checkpoint: Checkpoint) -> str:
+        return self._get_index_key(
+            checkpoint.admin_site_name,
+            checkpoint.app_label,
+            checkpoint.model_name,
+            checkpoint.action,
+            checkpoint.user_pk,
+        )
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        checkpoint.updated_at = timezone.now()
+        cache.set(self._get_key(checkpoint.id), checkpoint, self.timeout)
+
+        index_key = self._get_checkpoint_index_key(checkpoint)
+        index = cache.get(index_key, [])
+        if checkpoint.id not in index:
+            cache.set(index_key, [*index, checkpoint.id], self.timeout)
+
+    def get(self, checkpoint_id: str) -> "Checkpoint | None":
+        return cache.get(self._get_key(checkpoint_id))
+
+    def delete(self, checkpoint: Checkpoint) -> None:
+        cache.delete(self._get_key(checkpoint.id))
+
+        index_key = self._get_checkpoint_index_key(checkpoint)
+        index = cache.get(index_key, [])
+        cache.set(index_key, [id for id in index if id != checkpoint.id], self.timeout)
+
+    def filter(
+        self,
+        admin_site_name: str,
+        app_label: str,
+        model_name: str,
+        action: str,
+        user_pk: Any,
+    ) -> "list[Checkpoint]":
+        index = cache.get(
+            self._get_index_key(
+                admin_site_name, app_label, model_name, action, user_pk
+            ),
+            [],
+        )
+        checkpoints = cache.get_many([self._get_key(id) for id in index]).values()
+
+        return sorted(checkpoints, key=lambda c: c.updated_at, reverse=True)
+
+
+def resume_checkpoint(
+    checkpoint: Checkpoint, request: "HttpRequest | None" = None
+) -> "None | HttpResponse":
+    """
+    Resumes the action from the checkpoint, processing only objects after the last processed one.
+
+    If `request` is given, messages sent by the action are added to it, e.g. when resuming from the admin.
+    Actions created with `background=True` are submitted to their executor again.
+    When `max_concurrent` runs of the action are already executing, it is not resumed and an error message is sent instead.
+    """
+    from ..decorators import ALREADY_RUNNING_MESSAGE
+
+    action_request = checkpoint.get_request(
+        getattr(request, "_messages", None) if request is not None else None
+    )
+
+    modeladmin = get_registered_modeladmin(
+        checkpoint.admin_site_name, checkpoint.app_label, checkpoint.model_name
+    )
+    action = get_registered_action(modeladmin, action_request, checkpoint.action)
+    queryset, data = get_submitted_action_data(
+        action, modeladmin, checkpoint.action, action_request
+    )
+
+    # Resumed run counts towards `max_concurrent` runs of the action, like a submitted one
+    lock = None
+    if action.max_concurrent is not None:
+        lock = action.acquire_slot(modeladmin, checkpoint.action)
+
+        if lock is None:
+            modeladmin.message_user(
+                action_request, ALREADY_RUNNING_MESSAGE, messages.ERROR
+            )
+            return None
+
+    return action.start_action(
+        modeladmin,
+        action_request,
+        checkpoint.action,
+        queryset,
+        (queryset,),
+        data,
+        checkpoint,
+        lock,
+    )
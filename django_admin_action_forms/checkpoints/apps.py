@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class DjangoAdminActionFormsCheckpointsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "django_admin_action_forms.checkpoints"
+    label = "django_admin_action_forms_checkpoints"
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:17
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActionCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("admin_site_name", models.CharField(max_length=100)),
+                ("app_label", models.CharField(max_length=100)),
+                ("model_name", models.CharField(max_length=100)),
+                ("action", models.CharField(max_length=255)),
+                ("post_data", models.JSONField()),
+                ("query_string", models.TextField(blank=True)),
+                ("last_pk", models.CharField(blank=True, max_length=255, null=True)),
+                ("processed", models.PositiveBigIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["app_label", "model_name", "action", "user"],
+                        name="action_checkpoint_lookup_idx",
+                    )
+                ],
+            },
+        ),
+    ]
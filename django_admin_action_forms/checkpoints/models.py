@@ -0,0 +1,31 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class ActionCheckpoint(models.Model):
+    """
+    Progress of a long-running action stored by `DatabaseCheckpointStore`, allowing it to be resumed.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    admin_site_name = models.CharField(max_length=100)
+    app_label = models.CharField(max_length=100)
+    model_name = models.CharField(max_length=100)
+    action = models.CharField(max_length=255)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    post_data = models.JSONField()
+    query_string = models.TextField(blank=True)
+    last_pk = models.CharField(max_length=255, null=True, blank=True)
+    processed = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["app_label", "model_name", "action", "user"],
+                name="action_checkpoint_lookup_idx",
+            ),
+        ]
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.forms import ModelChoiceField
+from django.forms.models import ModelChoiceIterator
+from django.utils.translation import get_language
+
+CACHE_KEY_PREFIX = "django_admin_action_forms.choices"
+
+
+def _get_version_key(model: "type[Model]") -> str:
+    return f"{CACHE_KEY_PREFIX}.version.{model._meta.concrete_model._meta.label_lower}"
+
+
+def get_cached_choices_version(model: "type[Model]") -> str:
+    """
+    Returns version of cached choices of the model, which changes every time an object of the model is saved or deleted.
+    """
+    version_key = _get_version_key(model)
+    version = cache.get(version_key)
+
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, None)
+        version = cache.get(version_key)
+
+    return version
+
+
+def invalidate_cached_choices(sender: "type[Model]", **kwargs) -> None:
+    cache.set(_get_version_key(sender), uuid.uuid4().hex, None)
+
+
+def connect_cached_choices_invalidation(model: "type[Model]") -> None:
+    """
+    Invalidates cached choices of the model when any of its objects is saved or deleted.
+
+    Updates which do not send signals, e.g. `QuerySet.update()` or `bulk_create()`,
+    are reflected only after the cached choices expire.
+    """
+    for sender in {model, model._meta.concrete_model}:
+        dispatch_uid = f"{CACHE_KEY_PREFIX}.{sender._meta.label_lower}"
+        post_save.connect(
+            invalidate_cached_choices, sender=sender, dispatch_uid=dispatch_uid
+        )
+        post_delete.connect(
+            invalidate_cached_choices, sender=sender, dispatch_uid=dispatch_uid
+        )
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """
+    Iterates over choices of `ModelChoiceField` stored in the default cache for `timeout` seconds,
+    instead of loading all objects of its queryset every time the field is rendered.
+
+    Only rendering uses the cached choices, submitted values are still validated by the field using its queryset.
+    """
+
+    def __init__(self, field: ModelChoiceField, timeout: "int | None" = None):
+        super().__init__(field)
+        self.timeout = timeout
+        self._choices: "list[tuple[str, str]] | None" = None
+
+        connect_cached_choices_invalidation(self.queryset.model)
+
+    def get_cache_key(self) -> "str | None":
+        """
+        Returns key of the cached choices, which identifies the query, the labels and the version of the model,
+        or `None` if the queryset is known to be empty.
+        """
+        try:
+            sql = str(self.queryset.query)
+        except EmptyResultSet:
+            return None
+
+        model = self.queryset.model
+        key = json.dumps(
+            [
+                self.queryset.db,
+                sql,
+                type(self.field).__module__,
+                type(self.field).__qualname__,
+                self.field.to_field_name,
+                get_language(),
+            ]
+        )
+        return "%s.%s.%s.%s" % (
+            CACHE_KEY_PREFIX,
+            model._meta.label_lower,
+            get_cached_choices_version(model),
+            hashlib.sha256(key.encode()).hexdigest(),
+        )
+
+    def _load_choices(self) -> "list[tuple[str, str]]":
+        queryset = self.queryset
+        # Can't use iterator() when queryset uses prefetch_related()
+        if not queryset._prefetch_related_lookups:
+            queryset = queryset.iterator()
+        return [
+            (
+                str(self.field.prepare_value(obj)),
+                str(self.field.label_from_instance(obj)),
+            )
+            for obj in queryset
+        ]
+
+    def get_choices(self) -> "list[tuple[str, str]]":
+        if self._choices is None:
+            key = self.get_cache_key()
+            choices = cache.get(key) if key is not None else []
+
+            if choices is None:
+                choices = self._load_choices()
+                cache.set(key, choices, self.timeout)
+
+            self._choices = choices
+
+        return self._choices
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self.get_choices()
+
+    def __len__(self):
+        return len(self.get_choices()) + (
+            1 if self.field.empty_label is not None else 0
+        )
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.get_choices())
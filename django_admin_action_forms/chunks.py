@@ -0,0 +1,77 @@
+from typing import Any, Generator, NamedTuple
+
+from django.db import connections
+from django.db.models import QuerySet
+
+
+class Chunk(NamedTuple):
+    queryset: QuerySet
+    first_pk: Any
+    last_pk: Any
+    size: int
+
+
+def get_chunk(
+    queryset: QuerySet,
+    chunk_size: int,
+    after_pk: Any = None,
+    skip_locked: bool = False,
+) -> "Chunk | None":
+    """
+    Returns a chunk of at most `chunk_size` objects with primary key greater than `after_pk`,
+    or `None` if there are no more objects.
+
+    With `skip_locked` objects of the chunk are locked using `SELECT ... FOR UPDATE SKIP LOCKED`, skipping objects
+    locked by other transactions, so it has to be called inside a transaction in which the chunk is processed.
+    Backends without `SKIP LOCKED` use `SELECT ... FOR UPDATE`, or no locking when it is not supported either.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size should be a positive integer: '{chunk_size}'")
+
+    if skip_locked:
+        # Locking through a subquery avoids locking joined tables and works with distinct querysets
+        pks = queryset.model._base_manager.using(queryset.db).filter(
+            pk__in=queryset.values("pk")
+        )
+
+        features = connections[queryset.db].features
+        if features.has_select_for_update_skip_locked:
+            pks = pks.select_for_update(skip_locked=True)
+        elif features.has_select_for_update:
+            pks = pks.select_for_update()
+    else:
+        pks = queryset
+
+    pks = pks.order_by("pk").values_list("pk", flat=True)
+    if after_pk is not None:
+        pks = pks.filter(pk__gt=after_pk)
+
+    chunk_pks = list(pks[:chunk_size])
+
+    if not chunk_pks:
+        return None
+
+    if skip_locked:
+        # Objects locked by other transactions might be between the first and the last primary key
+        chunk_queryset = queryset.filter(pk__in=chunk_pks)
+    else:
+        chunk_queryset = queryset.filter(pk__lte=chunk_pks[-1])
+        if after_pk is not None:
+            chunk_queryset = chunk_queryset.filter(pk__gt=after_pk)
+
+    return Chunk(chunk_queryset, chunk_pks[0], chunk_pks[-1], len(chunk_pks))
+
+
+def iter_chunks(
+    queryset: QuerySet, chunk_size: int, after_pk: Any = None
+) -> "Generator[Chunk, None, None]":
+    """
+    Splits the queryset into chunks of at most `chunk_size` objects, ordered by primary key.
+
+    Each chunk is fetched only when the previous one was processed, using a primary key range
+    instead of `OFFSET`, so memory usage and query time do not depend on the size of the queryset.
+    """
+    while (chunk := get_chunk(queryset, chunk_size, after_pk)) is not None:
+        yield chunk
+
+        after_pk = chunk.last_pk
@@ -0,0 +1,188 @@
+import json
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+
+from django.db import DatabaseError, NotSupportedError, connections, transaction
+from django.db.models import QuerySet
+from django.utils.formats import number_format
+
+
+class ObjectsCount:
+    """
+    Number of objects displayed in the objects summary, which might be a lower bound or an estimate.
+    """
+
+    def __init__(
+        self, value: int, *, is_lower_bound: bool = False, is_estimate: bool = False
+    ):
+        self.value = value
+        self.is_lower_bound = is_lower_bound
+        self.is_estimate = is_estimate
+
+    def __int__(self):
+        return self.value
+
+    def __str__(self):
+        if self.is_lower_bound:
+            return "%s+" % number_format(self.value, force_grouping=True)
+        if self.is_estimate:
+            return "~%s" % number_format(self.value, force_grouping=True)
+        return str(self.value)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self}>"
+
+
+@contextmanager
+def _postgresql_statement_timeout(using: str, timeout: float):
+    with connections[using].cursor() as cursor:
+        cursor.execute("SHOW statement_timeout")
+        previous_timeout = cursor.fetchone()[0]
+        cursor.execute("SET LOCAL statement_timeout = %d" % int(timeout * 1000))
+
+        yield
+
+        # SET LOCAL outlives the savepoint when already inside a transaction, e.g. with ATOMIC_REQUESTS
+        cursor.execute("SET LOCAL statement_timeout = %s", [previous_timeout])
+
+
+@contextmanager
+def _sqlite_statement_timeout(using: str, timeout: float):
+    connection = connections[using]
+    connection.ensure_connection()
+    deadline = time.monotonic() + timeout
+
+    # Returning a truthy value from the progress handler interrupts the running query
+    connection.connection.set_progress_handler(
+        lambda: time.monotonic() > deadline, 1000
+    )
+    try:
+        yield
+    finally:
+        connection.connection.set_progress_handler(None, 0)
+
+
+# Backends missing from this mapping run counting queries without a time limit
+STATEMENT_TIMEOUTS: "dict[str, Callable[[str, float], object]]" = {
+    "postgresql": _postgresql_statement_timeout,
+    "sqlite": _sqlite_statement_timeout,
+}
+
+
+@contextmanager
+def statement_timeout(using: str, timeout: "float | None"):
+    """
+    Runs queries inside a savepoint, interrupting them after `timeout` seconds if the backend supports it.
+    """
+    with transaction.atomic(using=using):
+        vendor_timeout = STATEMENT_TIMEOUTS.get(connections[using].vendor)
+
+        if timeout is None or vendor_timeout is None:
+            yield
+        else:
+            with vendor_timeout(using, timeout):
+                yield
+
+
+class CountStrategy:
+    """
+    Base class for strategies used for counting objects in the objects summary.
+
+    When `fallback` is provided and counting fails or takes longer than `timeout` seconds,
+    the `fallback` strategy is used instead. `timeout` requires `fallback`, as there is nothing to display
+    when counting is interrupted.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: "float | None" = None,
+        fallback: "CountStrategy | None" = None,
+    ):
+        if timeout is not None and fallback is None:
+            raise ValueError(
+                f"{self.__class__.__name__} requires 'fallback' when 'timeout' is set."
+            )
+
+        self.timeout = timeout
+        self.fallback = fallback
+
+    def count(self, queryset: QuerySet) -> ObjectsCount:
+        raise NotImplementedError(
+            "Subclasses of CountStrategy must provide a count() method."
+        )
+
+    def get_count(self, queryset: QuerySet) -> ObjectsCount:
+        if self.fallback is None:
+            return self.count(queryset)
+
+        try:
+            with statement_timeout(queryset.db, self.timeout):
+                return self.count(queryset)
+        except DatabaseError:
+            return self.fallback.get_count(queryset)
+
+
+class ExactCount(CountStrategy):
+    """
+    Counts all objects using `COUNT(*)`.
+    """
+
+    def count(self, queryset: QuerySet) -> ObjectsCount:
+        return ObjectsCount(queryset.count())
+
+
+class CappedCount(CountStrategy):
+    """
+    Counts objects up to `limit`, displaying e.g. "10,000+" when there are more of them.
+    """
+
+    def __init__(self, limit: int = 10_000, **kwargs):
+        super().__init__(**kwargs)
+        self.limit = limit
+
+    def count(self, queryset: QuerySet) -> ObjectsCount:
+        count = queryset.order_by()[: self.limit + 1].count()
+
+        return ObjectsCount(min(count, self.limit), is_lower_bound=count > self.limit)
+
+
+def _postgresql_estimate(queryset: QuerySet) -> int:
+    sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class EstimatedCount(CountStrategy):
+    """
+    Uses the query planner's estimate of number of rows, which is based on table statistics
+    (e.g. `reltuples` in PostgreSQL) and does not scan the table.
+
+    Backends without an estimator in `estimators` use the `fallback` strategy, which defaults to `ExactCount`.
+    """
+
+    estimators: "dict[str, Callable[[QuerySet], int]]" = {
+        "postgresql": _postgresql_estimate,
+    }
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("fallback", ExactCount())
+        super().__init__(**kwargs)
+
+    def count(self, queryset: QuerySet) -> ObjectsCount:
+        estimator = self.estimators.get(connections[queryset.db].vendor)
+
+        if estimator is None:
+            raise NotSupportedError(
+                f"{self.__class__.__name__} does not support '{connections[queryset.db].vendor}' database."
+            )
+
+        return ObjectsCount(estimator(queryset), is_estimate=True)
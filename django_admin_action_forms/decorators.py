@@ -1,11 +1,156 @@
+import copy
+import threading
 from collections.abc import Callable
-from functools import wraps
+from functools import partial, wraps
+from inspect import iscoroutinefunction
+from typing import Any
 
+from asgiref.sync import async_to_sync
+
+from django.contrib import messages
 from django.contrib.admin import ModelAdmin, action
+from django.core.signals import request_finished, request_started
+from django.db import transaction
 from django.db.models import QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    HttpResponseRedirect,
+)
+from django.urls import reverse
+from django.utils.translation import gettext, gettext_lazy
 
+from .checkpoints import Checkpoint, CheckpointStore
+from .chunks import get_chunk
 from .forms import ActionForm
+from .idempotency import TOKEN_FIELD_NAME, IdempotencyStore
+from .locks import LockBackend, default_lock_backend
+from .parallel import run_in_processes
+from .tasks import ActionExecutor, ActionTask, default_executor
+
+DEFAULT_CHUNK_SIZE = 1000
+
+ALREADY_RUNNING_MESSAGE = gettext_lazy(
+    "This action is already running. Please try again later."
+)
+
+
+def _submit_background_task(
+    executor: ActionExecutor,
+    modeladmin: ModelAdmin,
+    action_name: str,
+    request: HttpRequest,
+    queryset: QuerySet,
+    checkpoint: "Checkpoint | None" = None,
+    lock: Any = None,
+    lock_backend: "LockBackend | None" = None,
+) -> HttpResponseRedirect:
+    try:
+        # Objects processed before the checkpoint are counted, but not processed again
+        if checkpoint is not None and checkpoint.last_pk is not None:
+            queryset = queryset.filter(pk__gt=checkpoint.last_pk)
+
+        task = ActionTask.from_action(modeladmin, action_name, request, queryset)
+        task.lock = lock
+        task.lock_backend = lock_backend
+
+        if checkpoint is not None:
+            task.checkpoint_id = checkpoint.id
+            task.processed = checkpoint.processed
+            task.total += checkpoint.processed
+        task.save()
+    except Exception:
+        if lock is not None:
+            lock_backend.release(lock)
+        raise
+
+    submitted = False
+
+    def submit() -> None:
+        nonlocal submitted
+        submitted = True
+        try:
+            executor.submit(task)
+        except Exception:
+            task.fail()
+            raise
+
+    # Task is submitted after the transaction is committed, so it sees all changes made during the request
+    transaction.on_commit(submit, using=queryset.db)
+
+    if not submitted:
+        _fail_task_if_not_submitted(task, lambda: submitted)
+
+    return HttpResponseRedirect(
+        reverse(
+            "%s:%s_%s_action_form_task"
+            % (
+                modeladmin.admin_site.name,
+                modeladmin.opts.app_label,
+                modeladmin.opts.model_name,
+            ),
+            kwargs={"task_id": task.id},
+        )
+    )
+
+
+# Tasks created during the request handled by the current thread, `None` outside of requests
+_request_tasks = threading.local()
+
+
+def _start_tracking_request_tasks(**kwargs) -> None:
+    _request_tasks.tasks = []
+
+
+def _fail_request_tasks_not_submitted(**kwargs) -> None:
+    tasks = getattr(_request_tasks, "tasks", None)
+    _request_tasks.tasks = None
+
+    for task, is_submitted in tasks or []:
+        if not is_submitted():
+            task.fail()
+
+
+request_started.connect(
+    _start_tracking_request_tasks,
+    dispatch_uid="django_admin_action_forms.start_tracking_request_tasks",
+)
+request_finished.connect(
+    _fail_request_tasks_not_submitted,
+    dispatch_uid="django_admin_action_forms.fail_request_tasks_not_submitted",
+)
+
+
+def _fail_task_if_not_submitted(
+    task: ActionTask, is_submitted: "Callable[[], bool]"
+) -> None:
+    """
+    Fails the task if it was not submitted when the request is finished, which happens when the transaction
+    is rolled back, e.g. by `ATOMIC_REQUESTS` after an error, as callbacks of `on_commit()` are then discarded.
+
+    Outside of requests, e.g. when resuming a checkpoint in a management command, the task is not tracked.
+    """
+    tasks = getattr(_request_tasks, "tasks", None)
+
+    if tasks is not None:
+        tasks.append((task, is_submitted))
+
+
+def _replay_submission(
+    modeladmin: ModelAdmin,
+    request: HttpRequest,
+    submission: "dict[str, Any] | None",
+) -> "None | HttpResponseBase":
+    if submission is None or submission["status"] == IdempotencyStore.PENDING:
+        modeladmin.message_user(
+            request,
+            gettext("This form was already submitted and the action is still running."),
+            messages.WARNING,
+        )
+        return None
+
+    return submission["response"]
 
 
 def action_with_form(
@@ -13,12 +158,224 @@ def action_with_form(
     *,
     permissions: "list[str] | None" = None,
     description: "str | None" = None,
+    background: bool = False,
+    executor: "ActionExecutor | None" = None,
+    chunk_size: "int | None" = None,
+    processes: "int | None" = None,
+    checkpoint_store: "CheckpointStore | None" = None,
+    skip_locked: bool = False,
+    max_concurrent: "int | None" = None,
+    concurrency_key: "str | None" = None,
+    lock_backend: "LockBackend | None" = None,
+    idempotency_store: "IdempotencyStore | None" = None,
 ):
     """
     Decorator used to create an action with a form, alternative to the default ``@admin.action`` decorator.
+
+    Decorated function can be a coroutine function, which is run using ``async_to_sync``.
+
+    With ``background=True`` the action is executed by ``executor`` after the form is submitted,
+    and the user is redirected to the page displaying its progress.
+
+    With ``chunk_size`` the action is called once for every chunk of selected objects, ordered by primary key,
+    and each call is made in a separate transaction.
+
+    With ``processes`` the selected objects are split into primary key ranges (of ``chunk_size`` objects,
+    if set), and the action is called for each of them in a pool of ``processes`` worker processes.
+
+    With ``checkpoint_store`` the action is processed in chunks and after each of them a checkpoint is saved,
+    so that an interrupted action can be resumed from the last processed object.
+
+    With ``skip_locked`` each chunk is locked using ``SELECT ... FOR UPDATE SKIP LOCKED`` in the transaction
+    in which it is processed, and objects locked by concurrent runs of the action are skipped.
+
+    With ``max_concurrent`` at most that many runs of the action, or of all actions sharing ``concurrency_key``,
+    are executed at the same time, and further submissions of the form display an error instead.
+
+    With ``idempotency_store`` every displayed form contains an idempotency token, and when the same form
+    is submitted again, e.g. by a double-click, the response of the first submission is returned
+    instead of running the action again.
     """
+    if processes is not None and (checkpoint_store is not None or skip_locked):
+        raise ValueError(
+            "processes cannot be used together with checkpoint_store or skip_locked."
+        )
+
+    if (checkpoint_store is not None or skip_locked) and chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    if max_concurrent is not None and max_concurrent < 1:
+        raise ValueError(
+            f"max_concurrent should be a positive integer: '{max_concurrent}'"
+        )
+
+    lock_backend = lock_backend or default_lock_backend
+
+    # Lock would be acquired by the process serving the request and never released by the worker
+    if background and not lock_backend.supports_background:
+        raise ValueError(
+            f"{lock_backend.__class__.__name__} cannot be used together with background."
+        )
 
     def decorator(action_function: "Callable[..., None | HttpResponse]"):
+        # Admin calls actions synchronously, so coroutine functions are run in the event loop of the server
+        sync_action_function = (
+            async_to_sync(action_function)
+            if iscoroutinefunction(action_function)
+            else action_function
+        )
+
+        def call_action(
+            modeladmin: ModelAdmin,
+            request: HttpRequest,
+            action_name: str,
+            args: "tuple[Any, ...]",
+            data: "dict[str, Any]",
+            checkpoint: "Checkpoint | None" = None,
+        ) -> "None | HttpResponse":
+            queryset = next((arg for arg in args if isinstance(arg, QuerySet)), None)
+
+            if queryset is not None and processes is not None:
+                return run_in_processes(
+                    modeladmin,
+                    request,
+                    action_name,
+                    queryset,
+                    data,
+                    processes,
+                    chunk_size,
+                )
+
+            if chunk_size is None or queryset is None:
+                return sync_action_function(modeladmin, request, *args, data)
+
+            action_task: "ActionTask | None" = getattr(request, "action_task", None)
+            saves_in_transaction = (
+                checkpoint is not None
+                and checkpoint_store.saves_in_transaction(queryset.db)
+            )
+            response = None
+            processed = checkpoint.processed if checkpoint is not None else 0
+            after_pk = checkpoint.last_pk if checkpoint is not None else None
+
+            while True:
+                with transaction.atomic(using=queryset.db):
+                    chunk = get_chunk(queryset, chunk_size, after_pk, skip_locked)
+
+                    if chunk is None:
+                        break
+
+                    chunk_args = [
+                        chunk.queryset if arg is queryset else arg for arg in args
+                    ]
+                    response = (
+                        sync_action_function(modeladmin, request, *chunk_args, data)
+                        or response
+                    )
+
+                    processed += chunk.size
+                    if checkpoint is not None:
+                        checkpoint.last_pk = chunk.last_pk
+                        checkpoint.processed = processed
+
+                        if saves_in_transaction:
+                            checkpoint_store.save(checkpoint)
+                        else:
+                            # Objects of a chunk which was rolled back would be skipped when resuming
+                            transaction.on_commit(
+                                partial(checkpoint_store.save, copy.copy(checkpoint)),
+                                using=queryset.db,
+                            )
+
+                after_pk = chunk.last_pk
+                if action_task is not None:
+                    action_task.update_progress(processed)
+
+            if saves_in_transaction:
+                checkpoint_store.delete(checkpoint)
+            elif checkpoint is not None:
+                # Runs after checkpoints saved on commit of an outer transaction
+                transaction.on_commit(
+                    partial(checkpoint_store.delete, checkpoint), using=queryset.db
+                )
+
+            return response
+
+        def acquire_slot(modeladmin: ModelAdmin, action_name: str) -> "Any | None":
+            """
+            Returns handle of an acquired slot of `max_concurrent` runs, or `None` if all of them are taken.
+            """
+            return lock_backend.acquire_slot(
+                concurrency_key
+                or "%s.%s.%s.%s"
+                % (
+                    modeladmin.admin_site.name,
+                    modeladmin.opts.app_label,
+                    modeladmin.opts.model_name,
+                    action_name,
+                ),
+                max_concurrent,
+            )
+
+        def start_action(
+            modeladmin: ModelAdmin,
+            request: HttpRequest,
+            action_name: str,
+            queryset: QuerySet,
+            args: "tuple[Any, ...]",
+            data: "dict[str, Any]",
+            checkpoint: "Checkpoint | None" = None,
+            lock: Any = None,
+        ) -> "None | HttpResponse":
+            """
+            Executes the action in background or during the request, holding the acquired slot until it is finished.
+            """
+            if background:
+                return _submit_background_task(
+                    executor or default_executor,
+                    modeladmin,
+                    action_name,
+                    request,
+                    queryset,
+                    checkpoint,
+                    lock,
+                    lock_backend,
+                )
+
+            try:
+                return call_action(
+                    modeladmin, request, action_name, args, data, checkpoint
+                )
+            finally:
+                if lock is not None:
+                    lock_backend.release(lock)
+
+        def run_action(
+            form: ActionForm,
+            modeladmin: ModelAdmin,
+            request: HttpRequest,
+            action_name: str,
+            queryset: QuerySet,
+            args: "tuple[Any, ...]",
+            data: "dict[str, Any]",
+        ) -> "None | HttpResponse":
+            lock = None
+            if max_concurrent is not None:
+                lock = acquire_slot(modeladmin, action_name)
+
+                if lock is None:
+                    form.add_error(None, ALREADY_RUNNING_MESSAGE)
+                    return form.action_form_view(request)
+
+            checkpoint = None
+            if checkpoint_store is not None:
+                checkpoint = Checkpoint.from_request(modeladmin, action_name, request)
+                checkpoint_store.save(checkpoint)
+
+            return start_action(
+                modeladmin, request, action_name, queryset, args, data, checkpoint, lock
+            )
+
         @wraps(action_function)
         def wrapper(*args):
             # Compatibility with django-no-queryset-admin-actions
@@ -37,9 +394,24 @@ def action_with_form(
 
             action_name = request.POST.getlist("action")[action_index]
 
+            submitted_from_changelist_view = (
+                request.POST.get("submitted_from_changelist_view", "0") == "1"
+            )
+
+            token = (
+                None
+                if submitted_from_changelist_view or idempotency_store is None
+                else request.POST.get(TOKEN_FIELD_NAME) or None
+            )
+
+            if token is not None:
+                submission = idempotency_store.get(token, request.user.pk)
+                if submission is not None:
+                    return _replay_submission(modeladmin, request, submission)
+
             form = (
                 form_class(modeladmin, action_name, request, queryset)
-                if request.POST.get("submitted_from_changelist_view", "0") == "1"
+                if submitted_from_changelist_view
                 else form_class(
                     modeladmin,
                     action_name,
@@ -51,16 +423,50 @@ def action_with_form(
             )
 
             if form.is_valid() and form.inlines_are_valid():
-                return action_function(
-                    modeladmin,
-                    request,
-                    *rest,
-                    {**form.cleaned_data, **form.inlines_cleaned_data},
-                )
+                data = {**form.cleaned_data, **form.inlines_cleaned_data}
+
+                if token is not None and not idempotency_store.claim(
+                    token, request.user.pk
+                ):
+                    return _replay_submission(
+                        modeladmin,
+                        request,
+                        idempotency_store.get(token, request.user.pk),
+                    )
+
+                try:
+                    response = run_action(
+                        form, modeladmin, request, action_name, queryset, rest, data
+                    )
+                except Exception:
+                    if token is not None:
+                        idempotency_store.release(token, request.user.pk)
+                    raise
+
+                if token is not None:
+                    if form.errors:
+                        # Action was not started, e.g. because of the concurrency limit
+                        idempotency_store.release(token, request.user.pk)
+                    else:
+                        idempotency_store.save_response(
+                            token, request.user.pk, response
+                        )
+
+                return response
 
             return form.action_form_view(request)
 
         setattr(wrapper, "form_class", form_class)
+        setattr(wrapper, "action_function", sync_action_function)
+        setattr(wrapper, "call_action", call_action)
+        setattr(wrapper, "checkpoint_store", checkpoint_store)
+        setattr(wrapper, "background", background)
+        setattr(wrapper, "executor", executor or default_executor)
+        setattr(wrapper, "lock_backend", lock_backend)
+        setattr(wrapper, "idempotency_store", idempotency_store)
+        setattr(wrapper, "max_concurrent", max_concurrent)
+        setattr(wrapper, "acquire_slot", acquire_slot)
+        setattr(wrapper, "start_action", start_action)
 
         return action(wrapper, permissions=permissions, description=description)
 
@@ -1,6 +1,12 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import copy
+import json
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .formsets import InlineAdminActionFormSet
 
 from django import VERSION as DJANGO_VERSION
@@ -19,7 +25,8 @@ from django.contrib.admin.widgets import (
     AdminURLFieldWidget,
     AdminUUIDInputWidget,
 )
-from django.db.models import QuerySet
+from django.core.exceptions import ValidationError
+from django.db.models import Model, QuerySet
 from django.forms import (
     CharField,
     ChoiceField,
@@ -29,6 +36,7 @@ from django.forms import (
     FileField,
     Form,
     IntegerField,
+    Media,
     ModelChoiceField,
     ModelMultipleChoiceField,
     RadioSelect,
@@ -46,6 +54,20 @@ from django.utils.functional import cached_property
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy
 
+# Django 5.0.x and above
+try:
+    from django.utils.choices import CallableChoiceIterator
+# Backwards compatibility for Django 4.2.x and below
+except ImportError:
+    from django.forms.fields import CallableChoiceIterator
+
+from .autocomplete import AutocompleteLabel
+from .checkpoints import Checkpoint, CheckpointStore
+from .choices import CachedModelChoiceIterator, connect_cached_choices_invalidation
+from .counts import CountStrategy, ObjectsCount
+from .fragments import get_permissions_key
+from .idempotency import TOKEN_FIELD_NAME, get_idempotency_token
+from .media import get_merged_media
 from .options import Options
 from .widgets import (
     AutocompleteSelect,
@@ -54,6 +76,11 @@ from .widgets import (
     FilterVerticalSelectMultiple,
 )
 
+# Form class -> Plan key -> Prepared fields, see `ActionForm._get_plan_key()`
+_prepared_fields: (
+    "WeakKeyDictionary[type[ActionForm], dict[tuple, dict[str, Field]]]"
+) = WeakKeyDictionary()
+
 
 class ActionForm(Form):
     """
@@ -76,20 +103,69 @@ class ActionForm(Form):
         self.request = request
         self.queryset = queryset
 
-        super().__init__(*args, **kwargs)
         self.opts = Options(self)
 
-        self._remove_excluded_fields()
+        # Fields with widgets, attributes and help texts prepared by the first form created for the same key
+        included_fields = flatten_fieldsets(self.opts.get_fieldsets(request))
+        self._plan_key = plan_key = self._get_plan_key(included_fields)
+        prepared_fields = _prepared_fields.get(type(self), {}).get(plan_key)
+
+        if prepared_fields is not None:
+            # Form copies prepared fields instead of declared ones
+            self.base_fields = prepared_fields
+
+        super().__init__(*args, **kwargs)
+
+        if prepared_fields is None:
+            self._prepare_fields(included_fields)
+            _prepared_fields.setdefault(type(self), {})[plan_key] = copy.deepcopy(
+                self.fields
+            )
+
         self._apply_limit_choices_to_on_model_choice_fields()
+        self._use_read_database_for_model_choice_fields()
+        self._use_cached_choices_for_model_choice_fields()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Signals are connected when the form is defined, so choices are invalidated also by processes
+        # which save objects without displaying the form
+        cached_choice_fields = getattr(
+            getattr(cls, "Meta", None), "cached_choice_fields", []
+        )
+        for base in reversed(cls.__mro__):
+            for field_name, field in getattr(base, "declared_fields", {}).items():
+                if (
+                    field_name in cached_choice_fields
+                    and isinstance(field, ModelChoiceField)
+                    and field.queryset is not None
+                ):
+                    connect_cached_choices_invalidation(field.queryset.model)
+
+    def _get_plan_key(self, included_fields: "list[str]") -> tuple:
+        """
+        Returns key of fields prepared by `_prepare_fields()`, which depend only on the form class,
+        fields included in fieldsets, the model admin and the action.
+        """
+        return (
+            tuple(included_fields),
+            self.modeladmin.admin_site.name,
+            self.modeladmin.opts.app_label,
+            self.modeladmin.opts.model_name,
+            self.action,
+        )
+
+    def _prepare_fields(self, included_fields: "list[str]") -> None:
+        self._remove_excluded_fields(included_fields)
         self._replace_widgets_for_filter_horizontal_and_vertical()
         self._replace_widgets_for_autocomplete_fields()
         self._replace_widgets_for_radio_fields()
         self._add_default_selectmultiple_widget_help_text()
         self._add_autocomplete_widget_attrs()
 
-    def _remove_excluded_fields(self) -> None:
+    def _remove_excluded_fields(self, included_fields: "list[str]") -> None:
         all_fields = set(self.fields.keys())
-        included_fields = set(flatten_fieldsets(self.opts.get_fieldsets(self.request)))
         excluded_fields = all_fields.difference(included_fields)
 
         for field_name in excluded_fields:
@@ -105,6 +181,29 @@ class ActionForm(Form):
                 if limit_choices_to is not None:
                     field.queryset = queryset.complex_filter(limit_choices_to)
 
+    def _use_read_database_for_model_choice_fields(self) -> None:
+        # Submitted values are validated using the default database, as the read database might be lagging behind
+        if self.opts.read_database is None or self.is_bound:
+            return
+
+        for field in self.fields.values():
+            if isinstance(field, (ModelChoiceField, ModelMultipleChoiceField)):
+                field.queryset = field.queryset.using(self.opts.read_database)
+
+    def _use_cached_choices_for_model_choice_fields(self) -> None:
+        # Only rendered choices are cached, the queryset of the field is still used to validate submitted values
+        for field_name, field in self.fields.items():
+            if (
+                field_name in self.opts.cached_choice_fields
+                and isinstance(field, ModelChoiceField)
+                and not isinstance(
+                    field.widget, (AutocompleteSelect, AutocompleteSelectMultiple)
+                )
+            ):
+                field.widget.choices = CachedModelChoiceIterator(
+                    field, self.opts.cached_choice_fields_timeout
+                )
+
     def _replace_widgets_for_filter_horizontal_and_vertical(self) -> None:
         filter_horizontal = self.opts.filter_horizontal
         filter_vertical = self.opts.filter_vertical
@@ -136,11 +235,15 @@ class ActionForm(Form):
                 if isinstance(field, ModelChoiceField):
                     field.widget = AutocompleteSelect(
                         choices=field.choices,
+                        label=self.opts.autocomplete_labels.get(field_name),
+                        **self.opts.autocomplete_widget_options.get(field_name, {}),
                     )
 
                 if isinstance(field, ModelMultipleChoiceField):
                     field.widget = AutocompleteSelectMultiple(
                         choices=field.choices,
+                        label=self.opts.autocomplete_labels.get(field_name),
+                        **self.opts.autocomplete_widget_options.get(field_name, {}),
                     )
 
             field.widget.is_required = field.required
@@ -176,25 +279,68 @@ class ActionForm(Form):
                 )
 
     def _add_autocomplete_widget_attrs(self) -> None:
+        url_name_prefix = "%s:%s_%s_action_form_autocomplete" % (
+            self.modeladmin.admin_site.name,
+            self.modeladmin.opts.app_label,
+            self.modeladmin.opts.model_name,
+        )
+        url, batch_url = None, None
+
         for field_name, field in self.fields.items():
             if isinstance(
                 field.widget, (AutocompleteSelect, AutocompleteSelectMultiple)
             ):
+                if url is None:
+                    url = reverse(url_name_prefix)
+                    batch_url = reverse(f"{url_name_prefix}_batch")
+
                 field.widget.attrs.update(
                     {
                         "data-action-name": self.action,
                         "data-field-name": field_name,
-                        "data-ajax--url": reverse(
-                            "%s:%s_%s_action_form_autocomplete"
-                            % (
-                                self.modeladmin.admin_site.name,
-                                self.modeladmin.opts.app_label,
-                                self.modeladmin.opts.model_name,
-                            )
-                        ),
+                        "data-ajax--url": url,
+                        "data-batch-url": batch_url,
                     }
                 )
 
+    def _get_fragment_cache_key(self) -> tuple:
+        return (
+            type(self),
+            self.prefix,
+            self._plan_key,
+            json.dumps(self.opts.get_fieldsets(self.request), default=str),
+            get_permissions_key(self.request.user),
+        )
+
+    @cached_property
+    def fragment_cache_key(self) -> "tuple | None":
+        """
+        Key of rendered fields of the form, used by the `{% cachedfragment %}` tag, or `None` if caching is not enabled
+        using `Meta.cache_rendered_fields` or the rendered fields depend on more than the fieldsets, e.g. on submitted data,
+        initial values or choices loaded from the database.
+        """
+        if not self.opts.cache_rendered_fields or self.is_bound or self.initial:
+            return None
+
+        for field in self.fields.values():
+            if (
+                callable(field.initial)
+                or isinstance(getattr(field, "choices", None), CallableChoiceIterator)
+                or (
+                    isinstance(field, ModelChoiceField)
+                    and (
+                        field.initial is not None
+                        or not isinstance(
+                            field.widget,
+                            (AutocompleteSelect, AutocompleteSelectMultiple),
+                        )
+                    )
+                )
+            ):
+                return None
+
+        return self._get_fragment_cache_key()
+
     @cached_property
     def fieldsets(self) -> "list[Fieldset]":
         return [
@@ -217,8 +363,15 @@ class ActionForm(Form):
             for InlineFormSet in self.opts.get_inlines(self.request)
         ]
 
-    @property
-    def media(self):
+    def _get_media_key(self) -> tuple:
+        return (
+            type(self),
+            tuple((name, type(field.widget)) for name, field in self.fields.items()),
+            tuple(fieldset.classes for fieldset in self.fieldsets),
+            tuple(inline._get_media_key() for inline in self.inlines),
+        )
+
+    def _get_media(self) -> Media:
         media = super().media
 
         # In Django<5.1, this adds "admin/js/collapse.js" when any fieldset has "collapse" class
@@ -230,6 +383,48 @@ class ActionForm(Form):
 
         return media
 
+    @property
+    def media(self):
+        return get_merged_media(self._get_media_key(), self._get_media)
+
+    def _load_selected_autocomplete_labels(self) -> None:
+        """
+        Loads labels of objects selected in autocomplete widgets of the form and forms of its inlines,
+        using one query for each field of each form class, instead of one query for each widget.
+        """
+        # (Form class, field name) -> (Widget, queryset, primary keys of selected objects, widgets of forms)
+        groups: "dict[tuple[type[ActionForm], str], tuple]" = {}
+
+        forms = [self, *(form for inline in self.inlines for form in inline)]
+
+        for form in forms:
+            for field_name, field in form.fields.items():
+                widget = field.widget
+                if not isinstance(
+                    widget, (AutocompleteSelect, AutocompleteSelectMultiple)
+                ):
+                    continue
+
+                _, queryset, pks, widgets = groups.setdefault(
+                    (type(form), field_name), (widget, field.queryset, set(), [])
+                )
+                widgets.append(widget)
+
+                for value in widget.format_value(form[field_name].value()):
+                    if str(value) in field.empty_values:
+                        continue
+                    # Invalid values, e.g. submitted by hand, are not displayed
+                    try:
+                        queryset.model._meta.pk.to_python(value)
+                    except ValidationError:
+                        continue
+                    pks.add(str(value))
+
+        for widget, queryset, pks, widgets in groups.values():
+            labels = widget.get_labels(queryset, pks) if pks else {}
+            for group_widget in widgets:
+                group_widget.selected_labels = labels
+
     def inlines_are_valid(self) -> bool:
         return all(inline.is_valid() for inline in self.inlines)
 
@@ -240,13 +435,84 @@ class ActionForm(Form):
             for inline in self.inlines
         }
 
+    def get_objects_count(self) -> ObjectsCount:
+        """
+        Returns number of objects displayed in the objects summary, counted using `Meta.objects_count_strategy`.
+        """
+        queryset = self.queryset
+        if self.opts.read_database is not None:
+            queryset = queryset.using(self.opts.read_database)
+
+        return self.opts.objects_count_strategy.get_count(queryset)
+
+    def get_list_objects_page(self, page_number: int = 1) -> "tuple[list[Model], bool]":
+        """
+        Returns objects from the given page of the objects list and whether there are more pages.
+        Size of the page is determined by `Meta.list_objects_limit`.
+        """
+        limit = self.opts.list_objects_limit
+        offset = (page_number - 1) * limit
+
+        queryset = self.opts.get_list_objects_queryset(self.request)
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+
+        # Fetching one more object tells whether there is a next page without counting all of them
+        objects = list(queryset[offset : offset + limit + 1])
+
+        return objects[:limit], len(objects) > limit
+
+    def get_checkpoints(
+        self, request: HttpRequest, action_function: "Callable[..., Any]"
+    ) -> "list[Checkpoint]":
+        """
+        Returns checkpoints of interrupted runs of the action by the user, which can be resumed.
+        """
+        checkpoint_store: "CheckpointStore | None" = getattr(
+            action_function, "checkpoint_store", None
+        )
+
+        if checkpoint_store is None:
+            return []
+
+        return checkpoint_store.filter(
+            self.modeladmin.admin_site.name,
+            self.modeladmin.opts.app_label,
+            self.modeladmin.opts.model_name,
+            self.action,
+            request.user.pk,
+        )
+
     def action_form_view(self, request: HttpRequest, extra_context: dict = None):
         admin_site = self.modeladmin.admin_site
         app_config = self.modeladmin.opts.app_config
 
+        list_objects_paginated = (
+            self.opts.list_objects and self.opts.list_objects_limit is not None
+        )
+
+        objects, objects_have_more = None, False
+
+        if list_objects_paginated:
+            objects, objects_have_more = self.get_list_objects_page()
+        elif self.opts.list_objects:
+            objects = self.opts.get_list_objects_queryset(request)
+
+        objects_count = (
+            self.get_objects_count()
+            if self.opts.objects_summary or list_objects_paginated
+            else None
+        )
+
+        self._load_selected_autocomplete_labels()
+
+        action_function, _, title = self.modeladmin.get_actions(request).get(
+            self.action
+        )
+
         context = {
             **admin_site.each_context(request),
-            "title": self.modeladmin.get_actions(request).get(self.action)[2],
+            "title": title,
             "subtitle": None,
             "app_label": app_config.label,
             "app_verbose_name": app_config.verbose_name,
@@ -255,16 +521,47 @@ class ActionForm(Form):
             "model_verbose_name_plural": self.modeladmin.opts.verbose_name_plural,
             "help_text": self.opts.help_text,
             "list_objects": self.opts.list_objects,
+            "list_objects_limit": self.opts.list_objects_limit,
             "objects_summary": self.opts.objects_summary,
             "queryset": self.queryset,
+            "objects": objects,
+            "objects_count": objects_count,
+            "objects_have_more": objects_have_more,
+            "objects_url": (
+                reverse(
+                    "%s:%s_%s_action_form_objects"
+                    % (
+                        admin_site.name,
+                        self.modeladmin.opts.app_label,
+                        self.modeladmin.opts.model_name,
+                    )
+                )
+                if list_objects_paginated
+                else None
+            ),
             "form": self,
             "fieldsets": self.fieldsets,
             "inlines": self.inlines,
             "action": self.action,
             "select_across": request.POST.get("select_across", "0"),
             "selected_action": request.POST.getlist("_selected_action"),
+            "idempotency_token_field_name": TOKEN_FIELD_NAME,
+            "idempotency_token": (
+                get_idempotency_token(request)
+                if getattr(action_function, "idempotency_store", None) is not None
+                else None
+            ),
             "confirm_button_text": self.opts.confirm_button_text,
             "cancel_button_text": self.opts.cancel_button_text,
+            "checkpoints": self.get_checkpoints(request, action_function),
+            "checkpoint_resume_url": reverse(
+                "%s:%s_%s_action_form_checkpoint_resume"
+                % (
+                    admin_site.name,
+                    self.modeladmin.opts.app_label,
+                    self.modeladmin.opts.model_name,
+                )
+            ),
             "django_version_above_6_1_x": (6, 1) <= DJANGO_VERSION,
             **(extra_context or {}),
         }
@@ -275,7 +572,13 @@ class ActionForm(Form):
 
         class Meta:
             list_objects: bool
+            list_objects_limit: "int | None"
+            list_objects_select_related: "bool | list[str]"
+            list_objects_prefetch_related: "list[str]"
+            list_objects_only: "list[str]"
             objects_summary: bool
+            objects_count_strategy: CountStrategy
+            read_database: "str | None"
             help_text: "str | None"
 
             fields: "list[str | tuple[str, ...]] | None"
@@ -287,6 +590,14 @@ class ActionForm(Form):
             filter_vertical: "list[str]"
             autocomplete_fields: "list[str]"
             radio_fields: "dict[str, int]"
+            autocomplete_labels: "dict[str, AutocompleteLabel]"
+            autocomplete_widget_options: "dict[str, dict[str, Any]]"
+            autocomplete_search_fields: "dict[str, list[str] | Callable[[HttpRequest, QuerySet, str], QuerySet]]"
+            autocomplete_cache_timeout: "int | None"
+            autocomplete_cache_max_entries: int
+            cached_choice_fields: "list[str]"
+            cached_choice_fields_timeout: "int | None"
+            cache_rendered_fields: bool
 
             inlines: "list[type[InlineAdminActionFormSet]]"
 
@@ -305,6 +616,10 @@ class ActionForm(Form):
                 self, request: HttpRequest
             ) -> "list[type[InlineAdminActionFormSet]]": ...
 
+            def get_list_objects_queryset(
+                self, request: HttpRequest, queryset: QuerySet
+            ) -> QuerySet: ...
+
 
 class AdminActionForm(ActionForm):
     """
@@ -312,8 +627,8 @@ class AdminActionForm(ActionForm):
     with corresponding admin widgets.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def _prepare_fields(self, included_fields: "list[str]") -> None:
+        super()._prepare_fields(included_fields)
         self._replace_default_field_widgets_with_admin_widgets()
 
     ADMIN_WIDGETS_FOR_FIELDS: "dict[type[Field], type[Widget]]" = {
@@ -346,6 +661,9 @@ class InlineActionForm(ActionForm):
         self.formset = formset
         super().__init__(*args, **kwargs)
 
+    def _get_plan_key(self, included_fields: "list[str]") -> tuple:
+        return (*super()._get_plan_key(included_fields), self.formset.name)
+
     def _add_autocomplete_widget_attrs(self):
         super()._add_autocomplete_widget_attrs()
         for field in self.fields.values():
@@ -3,12 +3,15 @@ from typing import TYPE_CHECKING, Generator, TypedDict, Any
 if TYPE_CHECKING:
     from .forms import InlineActionForm
 
+import copy
 import json
+from collections.abc import Callable
 
 from django import VERSION as DJANGO_VERSION
 from django.contrib.admin.utils import flatten_fieldsets
-from django.db.models import QuerySet
-from django.forms import Media, Widget
+from django.core.exceptions import ValidationError
+from django.db.models import Model, QuerySet
+from django.forms import Media, ModelChoiceField, ModelMultipleChoiceField, Widget
 from django.forms.formsets import BaseFormSet, DEFAULT_MIN_NUM, DEFAULT_MAX_NUM
 from django.forms.renderers import get_default_renderer
 from django.http import HttpRequest
@@ -16,6 +19,8 @@ from django.template.defaultfilters import capfirst
 from django.utils.functional import cached_property
 from django.utils.translation import gettext
 
+from .media import get_merged_media
+
 # Django 4.0.x and above
 try:
     from django.forms.utils import RenderableMixin
@@ -146,6 +151,62 @@ class InlineAdminActionFormSet(BaseFormSet, RenderableMixin):
             "queryset": self.queryset,
         }
 
+    def full_clean(self):
+        if self.is_bound:
+            self._prefetch_model_choices()
+        super().full_clean()
+
+    def _prefetch_model_choices(self) -> None:
+        """
+        Loads objects chosen in model choice fields of all forms using one query for each field,
+        instead of validating the value of each form using a separate query.
+
+        Values which are not found, e.g. invalid ones, are validated by the field as usual,
+        so error messages do not change.
+        """
+        if not self.forms:
+            return
+
+        for field_name, field in self.forms[0].fields.items():
+            if not isinstance(field, ModelChoiceField):
+                continue
+
+            key = field.to_field_name or "pk"
+            key_field = (
+                field.queryset.model._meta.pk
+                if key == "pk"
+                else field.queryset.model._meta.get_field(key)
+            )
+            values = set()
+
+            for form in self.forms:
+                data = form[field_name].data
+                for value in data if isinstance(data, (list, tuple)) else [data]:
+                    if value in field.empty_values:
+                        continue
+                    try:
+                        key_field.to_python(value)
+                    except ValidationError:
+                        continue
+                    values.add(str(value))
+
+            if not values:
+                continue
+
+            objects = {
+                str(getattr(obj, key)): obj
+                for obj in field.queryset.filter(**{f"{key}__in": values})
+            }
+
+            for form in self.forms:
+                form_field = form.fields[field_name]
+                if isinstance(form_field, ModelMultipleChoiceField):
+                    form_field._check_values = _check_prefetched_values(
+                        form_field, objects
+                    )
+                else:
+                    form_field.to_python = _to_python_prefetched(form_field, objects)
+
     def fields(self) -> "Generator[InlineFieldDict, None, None]":
         for field_name in flatten_fieldsets(
             self.empty_form.opts.get_fieldsets(self.request)
@@ -159,12 +220,31 @@ class InlineAdminActionFormSet(BaseFormSet, RenderableMixin):
                 "help_text": form_field.help_text,
             }
 
+    @cached_property
+    def fragment_cache_key(self) -> "tuple | None":
+        """
+        Key of rendered parts of the formset which depend only on fields of its forms, e.g. headers of columns,
+        or `None` if caching is not enabled using `Meta.cache_rendered_fields` of the inline form.
+        """
+        if not self.empty_form.opts.cache_rendered_fields:
+            return None
+
+        return (type(self), *self.empty_form._get_fragment_cache_key())
+
     @cached_property
     def is_collapsible(self):
         return False if any(self.errors) else "collapse" in self.classes
 
+    def _get_media_key(self) -> tuple:
+        # Media of the formset are media of its first form, see `BaseFormSet.media`
+        form = self.forms[0] if self.forms else self.empty_form
+        return (type(self), self.is_collapsible, form._get_media_key())
+
     @property
     def media(self):
+        return get_merged_media(self._get_media_key(), self._get_media)
+
+    def _get_media(self) -> Media:
         media = super().media
 
         media += Media(
@@ -215,6 +295,45 @@ class InlineAdminActionFormSet(BaseFormSet, RenderableMixin):
     __html__ = RenderableMixin.render
 
 
+def _to_python_prefetched(
+    field: ModelChoiceField, objects: "dict[str, Model]"
+) -> "Callable[[Any], Model | None]":
+    to_python = field.to_python
+
+    def to_python_prefetched(value: Any) -> "Model | None":
+        obj = objects.get(str(value)) if value not in field.empty_values else None
+        # Each form receives its own instance, as it would from the database
+        return copy.copy(obj) if obj is not None else to_python(value)
+
+    return to_python_prefetched
+
+
+def _check_prefetched_values(
+    field: ModelMultipleChoiceField, objects: "dict[str, Model]"
+) -> "Callable[[Any], QuerySet]":
+    check_values = field._check_values
+    key = field.to_field_name or "pk"
+
+    def check_prefetched_values(value: Any) -> QuerySet:
+        try:
+            values = frozenset(str(val) for val in value)
+        except TypeError:
+            return check_values(value)
+
+        if not values.issubset(objects):
+            return check_values(value)
+
+        # Queryset is returned already evaluated, in order of the field queryset, as it would be by the field
+        queryset = field.queryset.filter(**{f"{key}__in": values})
+        queryset._result_cache = [
+            copy.copy(obj) for pk, obj in objects.items() if pk in values
+        ]
+        queryset._prefetch_done = True
+        return queryset
+
+    return check_prefetched_values
+
+
 class StackedAdminActionInline(InlineAdminActionFormSet):
     template = "django_admin_action_forms/inlines/stacked.html"
 
@@ -0,0 +1,52 @@
+from typing import Any
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from django.utils.safestring import SafeString, mark_safe
+from django.utils.translation import get_language
+
+MAX_ENTRIES = 1000
+
+_fragments: "OrderedDict[tuple, SafeString]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_permissions_key(user: Any) -> str:
+    """
+    Returns key identifying permissions of the user, shared by users with the same permissions.
+    """
+    if user.is_active and user.is_superuser:
+        return "superuser"
+
+    return hashlib.sha256(
+        ",".join(sorted(user.get_all_permissions())).encode()
+    ).hexdigest()
+
+
+def get_cached_fragment(key: tuple, render: "Callable[[], str]") -> SafeString:
+    """
+    Returns fragment of a template rendered by `render()`, stored for `key` and current language.
+    Key should identify everything the fragment depends on, e.g. the form class and its fieldsets.
+
+    Fragments are stored in memory of the process, up to `MAX_ENTRIES` least recently used ones,
+    so they are discarded when the code is reloaded.
+    """
+    key = (*key, get_language())
+
+    with _lock:
+        fragment = _fragments.get(key)
+        if fragment is not None:
+            _fragments.move_to_end(key)
+            return fragment
+
+    fragment = mark_safe(render())
+
+    with _lock:
+        _fragments[key] = fragment
+        while len(_fragments) > MAX_ENTRIES:
+            _fragments.popitem(last=False)
+
+    return fragment
@@ -0,0 +1,87 @@
+from typing import Any
+
+import uuid
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponseBase
+
+TOKEN_FIELD_NAME = "_idempotency_token"
+
+
+def get_idempotency_token(request: HttpRequest) -> str:
+    """
+    Returns token rendered in the action form, reusing the submitted one when the form is displayed again,
+    e.g. because of validation errors.
+    """
+    return request.POST.get(TOKEN_FIELD_NAME) or uuid.uuid4().hex
+
+
+class IdempotencyStore:
+    """
+    Stores outcomes of submitted action forms in the default cache for `timeout` seconds,
+    so that a form submitted more than once, e.g. by a double-click or a browser retry, runs the action only once.
+
+    Cache has to be shared between processes serving the admin, e.g. Redis or Memcached.
+    Responses with content larger than `max_response_size` bytes are not stored, as they might not fit into the cache,
+    e.g. Memcached stores items of at most 1 MB by default.
+    """
+
+    PENDING = "pending"
+    FINISHED = "finished"
+
+    cache_key_prefix: str = "django_admin_action_forms.idempotency"
+
+    def __init__(
+        self, timeout: int = 60 * 60, max_response_size: "int | None" = 256 * 1024
+    ):
+        self.timeout = timeout
+        self.max_response_size = max_response_size
+
+    def get_cache_key(self, token: str, user_pk: Any) -> str:
+        return f"{self.cache_key_prefix}.{user_pk}.{token}"
+
+    def claim(self, token: str, user_pk: Any) -> bool:
+        """
+        Marks the token as used, returns `False` if it was already used.
+        """
+        return cache.add(
+            self.get_cache_key(token, user_pk), {"status": self.PENDING}, self.timeout
+        )
+
+    def release(self, token: str, user_pk: Any) -> None:
+        """
+        Allows the token to be used again, e.g. when the action failed.
+        """
+        cache.delete(self.get_cache_key(token, user_pk))
+
+    def get(self, token: str, user_pk: Any) -> "dict[str, Any] | None":
+        return cache.get(self.get_cache_key(token, user_pk))
+
+    def is_storable(self, response: HttpResponseBase) -> bool:
+        # Streaming responses, e.g. file downloads, cannot be replayed
+        if response.streaming or not getattr(response, "is_rendered", True):
+            return False
+
+        return (
+            self.max_response_size is None
+            or len(response.content) <= self.max_response_size
+        )
+
+    def save_response(
+        self, token: str, user_pk: Any, response: "HttpResponseBase | None"
+    ) -> None:
+        if response is not None and not self.is_storable(response):
+            response = None
+
+        key = self.get_cache_key(token, user_pk)
+
+        try:
+            cache.set(
+                key, {"status": self.FINISHED, "response": response}, self.timeout
+            )
+        except Exception:
+            # Response could not be pickled, e.g. because of an attribute set by the action
+            cache.set(key, {"status": self.FINISHED, "response": None}, self.timeout)
+
+
+default_idempotency_store = IdempotencyStore()
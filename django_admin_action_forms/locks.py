@@ -0,0 +1,154 @@
+from typing import Any
+
+import hashlib
+import os
+import tempfile
+import uuid
+
+from django.core.cache import cache
+from django.db import NotSupportedError, connections
+
+
+class LockBackend:
+    """
+    Base class for locks used for limiting number of concurrent runs of an action.
+
+    A limit of `N` concurrent runs is implemented as `N` separate locks, called slots.
+
+    Backends whose locks can be released only by the process that acquired them should set `supports_background`
+    to `False`, as locks of actions executed in background are released by the worker.
+    """
+
+    supports_background: bool = True
+
+    def acquire(self, name: str) -> "Any | None":
+        """
+        Tries to acquire the lock without waiting. Returns a handle used for releasing the lock,
+        or `None` if the lock is already held.
+        """
+        raise NotImplementedError(
+            "Subclasses of LockBackend must provide an acquire() method."
+        )
+
+    def release(self, handle: Any) -> None:
+        raise NotImplementedError(
+            "Subclasses of LockBackend must provide a release() method."
+        )
+
+    def acquire_slot(self, name: str, limit: int) -> "Any | None":
+        for slot in range(limit):
+            handle = self.acquire(f"{name}.{slot}")
+            if handle is not None:
+                return handle
+        return None
+
+
+class CacheLockBackend(LockBackend):
+    """
+    Uses atomic `cache.add()` of the default cache, which works across processes and hosts
+    when the cache is shared, e.g. Redis or Memcached.
+
+    Locks expire after `timeout` seconds, in case the process holding them was killed.
+    """
+
+    cache_key_prefix: str = "django_admin_action_forms.lock"
+
+    def __init__(self, timeout: int = 60 * 60):
+        self.timeout = timeout
+
+    def acquire(self, name: str) -> "tuple[str, str] | None":
+        key = f"{self.cache_key_prefix}.{name}"
+        token = uuid.uuid4().hex
+
+        if cache.add(key, token, self.timeout):
+            return key, token
+        return None
+
+    def release(self, handle: "tuple[str, str]") -> None:
+        key, token = handle
+
+        # Do not release the lock if it expired and was acquired by another run
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+class DatabaseAdvisoryLockBackend(LockBackend):
+    """
+    Uses PostgreSQL session-level advisory locks, which are released automatically when the connection is closed.
+
+    Locks are held by the connection of the thread that acquired them, so they cannot be used with actions
+    executed in background, and `@action_with_form` raises `ValueError` when both are set.
+    """
+
+    supports_background = False
+
+    def __init__(self, using: str = "default"):
+        self.using = using
+
+    @staticmethod
+    def _get_lock_id(name: str) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(name.encode(), digest_size=8).digest(), "big", signed=True
+        )
+
+    def acquire(self, name: str) -> "int | None":
+        connection = connections[self.using]
+
+        if connection.vendor != "postgresql":
+            raise NotSupportedError(
+                f"{self.__class__.__name__} supports only PostgreSQL database."
+            )
+
+        lock_id = self._get_lock_id(name)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+            acquired = cursor.fetchone()[0]
+
+        return lock_id if acquired else None
+
+    def release(self, handle: int) -> None:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [handle])
+
+
+class FileLockBackend(LockBackend):
+    """
+    Uses `flock()` on files in `directory`, which works for all processes on a single host.
+    Available only on Unix systems.
+
+    Handles are file descriptors of the process that acquired the locks, so they cannot be used with actions
+    executed in background, and `@action_with_form` raises `ValueError` when both are set.
+    """
+
+    supports_background = False
+
+    def __init__(self, directory: "str | None" = None):
+        self.directory = directory or tempfile.gettempdir()
+
+    def acquire(self, name: str) -> "int | None":
+        import fcntl
+
+        path = os.path.join(
+            self.directory,
+            "django_admin_action_forms.%s.lock"
+            % hashlib.sha256(name.encode()).hexdigest(),
+        )
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+
+        return fd
+
+    def release(self, handle: int) -> None:
+        import fcntl
+
+        fcntl.flock(handle, fcntl.LOCK_UN)
+        os.close(handle)
+
+
+default_lock_backend = CacheLockBackend()
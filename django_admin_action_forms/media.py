@@ -0,0 +1,38 @@
+from collections.abc import Callable
+
+from django.conf import settings
+from django.forms import Media
+from django.utils.translation import get_language
+
+
+class MergedMedia(Media):
+    """
+    Media with already merged lists of files, which are rendered only once.
+    """
+
+    _rendered: "str | None" = None
+
+    def render(self):
+        if self._rendered is None:
+            self._rendered = super().render()
+        return self._rendered
+
+
+_merged_media: "dict[tuple, MergedMedia]" = {}
+
+
+def get_merged_media(key: tuple, get_media: "Callable[[], Media]") -> MergedMedia:
+    """
+    Returns media returned by `get_media()`, stored for `key`, current language and `DEBUG` setting.
+    Key should identify everything the media depends on, e.g. the form class and classes of its widgets.
+
+    Media are stored already merged and rendered, so including them in a template does not sort their files again.
+    """
+    key = (*key, get_language(), settings.DEBUG)
+    media = _merged_media.get(key)
+
+    if media is None:
+        media = get_media()
+        media = _merged_media[key] = MergedMedia(css=media._css, js=media._js)
+
+    return media
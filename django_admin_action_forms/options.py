@@ -1,17 +1,28 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .forms import ActionForm
 
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy
 
+from .autocomplete import AutocompleteLabel
+from .counts import CountStrategy, ExactCount
 from .formsets import InlineAdminActionFormSet
 
 
 class Options:
     list_objects: bool
+    list_objects_limit: "int | None"
+    list_objects_select_related: "bool | list[str]"
+    list_objects_prefetch_related: "list[str]"
+    list_objects_only: "list[str]"
     objects_summary: bool
+    objects_count_strategy: CountStrategy
+    read_database: "str | None"
     help_text: "str | None"
     fields: "list[str | tuple[str, ...]] | None"
     fieldsets: "list[tuple[str|None, dict[str, list[str | tuple[str, ...]]]]] | None"
@@ -19,6 +30,16 @@ class Options:
     filter_vertical: "list[str]"
     autocomplete_fields: "list[str]"
     radio_fields: "dict[str, int]"
+    autocomplete_labels: "dict[str, AutocompleteLabel]"
+    autocomplete_widget_options: "dict[str, dict[str, Any]]"
+    autocomplete_search_fields: (
+        "dict[str, list[str] | Callable[[HttpRequest, QuerySet, str], QuerySet]]"
+    )
+    autocomplete_cache_timeout: "int | None"
+    autocomplete_cache_max_entries: int
+    cached_choice_fields: "list[str]"
+    cached_choice_fields_timeout: "int | None"
+    cache_rendered_fields: bool
     inlines: "list[type[InlineAdminActionFormSet]]"
     confirm_button_text: str
     cancel_button_text: str
@@ -28,7 +49,19 @@ class Options:
         self._meta = form.Meta() if hasattr(form, "Meta") else None
 
         self.list_objects = getattr(self._meta, "list_objects", False)
+        self.list_objects_limit = getattr(self._meta, "list_objects_limit", None)
+        self.list_objects_select_related = getattr(
+            self._meta, "list_objects_select_related", False
+        )
+        self.list_objects_prefetch_related = getattr(
+            self._meta, "list_objects_prefetch_related", []
+        )
+        self.list_objects_only = getattr(self._meta, "list_objects_only", [])
         self.objects_summary = getattr(self._meta, "objects_summary", self.list_objects)
+        self.objects_count_strategy = getattr(
+            self._meta, "objects_count_strategy", ExactCount()
+        )
+        self.read_database = getattr(self._meta, "read_database", None)
         self.help_text = getattr(self._meta, "help_text", None)
         self.fields = getattr(self._meta, "fields", None)
         self.fieldsets = getattr(self._meta, "fieldsets", None)
@@ -36,6 +69,24 @@ class Options:
         self.filter_vertical = getattr(self._meta, "filter_vertical", [])
         self.autocomplete_fields = getattr(self._meta, "autocomplete_fields", [])
         self.radio_fields = getattr(self._meta, "radio_fields", {})
+        self.autocomplete_labels = getattr(self._meta, "autocomplete_labels", {})
+        self.autocomplete_widget_options = getattr(
+            self._meta, "autocomplete_widget_options", {}
+        )
+        self.autocomplete_search_fields = getattr(
+            self._meta, "autocomplete_search_fields", {}
+        )
+        self.autocomplete_cache_timeout = getattr(
+            self._meta, "autocomplete_cache_timeout", None
+        )
+        self.autocomplete_cache_max_entries = getattr(
+            self._meta, "autocomplete_cache_max_entries", 1000
+        )
+        self.cached_choice_fields = getattr(self._meta, "cached_choice_fields", [])
+        self.cached_choice_fields_timeout = getattr(
+            self._meta, "cached_choice_fields_timeout", None
+        )
+        self.cache_rendered_fields = getattr(self._meta, "cache_rendered_fields", False)
         self.inlines = getattr(self._meta, "inlines", None)
         self.confirm_button_text = getattr(
             self._meta, "confirm_button_text", gettext_lazy("Confirm")
@@ -49,7 +100,8 @@ class Options:
             return self._meta.get_fields(request)
         if self.fields is not None:
             return self.fields
-        return tuple(self._form.fields.keys())
+        # Fields of the form are not yet created when its fieldsets are determined in `ActionForm.__init__()`
+        return tuple(getattr(self._form, "fields", self._form.base_fields).keys())
 
     def get_fieldsets(
         self, request: HttpRequest
@@ -68,3 +120,19 @@ class Options:
         if self.inlines is not None:
             return self.inlines
         return []
+
+    def get_list_objects_queryset(self, request: HttpRequest) -> QuerySet:
+        queryset = self._form.queryset
+        if self.read_database is not None:
+            queryset = queryset.using(self.read_database)
+        if hasattr(self._meta, "get_list_objects_queryset"):
+            return self._meta.get_list_objects_queryset(request, queryset)
+        if self.list_objects_select_related is True:
+            queryset = queryset.select_related()
+        elif self.list_objects_select_related:
+            queryset = queryset.select_related(*self.list_objects_select_related)
+        if self.list_objects_prefetch_related:
+            queryset = queryset.prefetch_related(*self.list_objects_prefetch_related)
+        if self.list_objects_only:
+            queryset = queryset.only(*self.list_objects_only)
+        return queryset
@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from django.contrib.admin import ModelAdmin
+    from django.db.models.sql import Query
+
+    from .tasks import ActionTask
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.contrib import messages
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.translation import gettext
+
+from .chunks import iter_chunks
+from .tasks import (
+    MessagesCollector,
+    get_action_request,
+    get_registered_action,
+    get_registered_modeladmin,
+)
+
+
+def _init_worker(database_names: "dict[str, str]") -> None:
+    django.setup()
+
+    # Names of databases might have been changed at runtime, e.g. by the test runner
+    for alias, name in database_names.items():
+        connections[alias].settings_dict["NAME"] = name
+
+
+def _run_partition(
+    admin_site_name: str,
+    app_label: str,
+    model_name: str,
+    action_name: str,
+    user_pk: Any,
+    query: "Query",
+    data: "dict[str, Any]",
+) -> "list[tuple[int, str, str]]":
+    try:
+        modeladmin = get_registered_modeladmin(admin_site_name, app_label, model_name)
+        collected_messages = MessagesCollector()
+        request = get_action_request(user_pk, collected_messages)
+
+        action_function = get_registered_action(
+            modeladmin, request, action_name
+        ).action_function
+
+        queryset = apps.get_model(app_label, model_name)._default_manager.all()
+        queryset.query = query
+
+        with transaction.atomic(using=queryset.db):
+            action_function(modeladmin, request, queryset, data)
+
+        return [
+            (message.level, str(message), message.extra_tags or "")
+            for message in collected_messages
+        ]
+    finally:
+        connections.close_all()
+
+
+def run_in_processes(
+    modeladmin: "ModelAdmin",
+    request: HttpRequest,
+    action_name: str,
+    queryset: QuerySet,
+    data: "dict[str, Any]",
+    processes: int,
+    partition_size: "int | None" = None,
+) -> None:
+    """
+    Splits the queryset into primary key ranges and calls the action for each of them in a separate process.
+
+    Workers are started using the "spawn" method, so they set up Django and open their own database connections.
+    Messages sent by the action in workers, as well as errors, are sent to the user after all partitions are processed.
+    """
+    if partition_size is None:
+        partition_size = max(math.ceil(queryset.count() / processes), 1)
+
+    database_names = {
+        alias: connections[alias].settings_dict["NAME"] for alias in connections
+    }
+    action_task: "ActionTask | None" = getattr(request, "action_task", None)
+
+    collected_messages: "dict[tuple[int, str, str], None]" = {}
+    errors: "list[str]" = []
+    partitions = 0
+    processed = 0
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(database_names,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _run_partition,
+                modeladmin.admin_site.name,
+                modeladmin.opts.app_label,
+                modeladmin.opts.model_name,
+                action_name,
+                request.user.pk,
+                chunk.queryset.query,
+                data,
+            ): chunk
+            for chunk in iter_chunks(queryset, partition_size)
+        }
+
+        for future in as_completed(futures):
+            partitions += 1
+
+            try:
+                collected_messages.update(dict.fromkeys(future.result()))
+            except Exception as error:
+                chunk = futures[future]
+                errors.append(f"{chunk.first_pk}-{chunk.last_pk}: {error}")
+
+            processed += futures[future].size
+            if action_task is not None:
+                action_task.update_progress(processed)
+
+    for level, message, extra_tags in collected_messages:
+        modeladmin.message_user(request, message, level, extra_tags)
+
+    if errors:
+        modeladmin.message_user(
+            request,
+            gettext("%(failed)d of %(total)d parts failed: %(errors)s")
+            % {"failed": len(errors), "total": partitions, "errors": "; ".join(errors)},
+            messages.ERROR,
+        )
@@ -3,31 +3,161 @@
 // ActionForm field that is being autocompleted.
 // When autocomplete is used inside inline, `field_name` is not enough and `inline_name` is needed to identify the correct field
 // and not use the field from the ActionForm that has the same name.
+// Next pages are requested using `cursor` returned with the previous page, if available.
+// First pages of results of all autocomplete fields on the page, including fields of inlines, are requested
+// in a single batch request when the page is loaded, and used instead of requests made when widgets are opened.
+// Results are shared by all widgets of the same field, e.g. in rows of an inline, and the next page of results
+// is requested when the user starts scrolling the current one.
 
 'use strict';
 {
     const $ = django.jQuery;
 
+    // Maximum number of pages of results stored by `resultsCache`
+    const RESULTS_CACHE_MAX_ENTRIES = 100;
+
+    // Promises of first pages of results, keyed by batch URL, action and field
+    const prefetchedResults = {};
+
+    // Promises of pages of results, keyed by URL and request data, ordered from the least recently used
+    const resultsCache = new Map();
+
+    const getFieldKey = (element) => {
+        const inlineName = element.dataset.inlineName;
+        return (inlineName ? inlineName + '.' : '') + element.dataset.fieldName;
+    };
+
+    const getPrefetchKey = (element) => {
+        return [element.dataset.batchUrl, element.dataset.actionName, getFieldKey(element)].join(' ');
+    };
+
+    const getRequestData = (element, params) => {
+        return {
+            term: params.term,
+            page: params.page,
+            cursor: params.cursor,
+            action_name: element.dataset.actionName,
+            field_name: element.dataset.fieldName,
+            inline_name: element.dataset.inlineName,
+        };
+    };
+
+    const fetchResults = function (url, data) {
+        const key = JSON.stringify([
+            url,
+            data.action_name,
+            data.inline_name || '',
+            data.field_name,
+            data.term || '',
+            data.page || 1,
+            data.cursor || '',
+        ]);
+        let results = resultsCache.get(key);
+
+        if (results === undefined) {
+            results = $.ajax({url: url, type: 'GET', data: data}).promise();
+            // Failed requests are not cached, so they are retried
+            results.fail(() => resultsCache.get(key) === results && resultsCache.delete(key));
+
+            if (resultsCache.size >= RESULTS_CACHE_MAX_ENTRIES) {
+                resultsCache.delete(resultsCache.keys().next().value);
+            }
+        } else {
+            resultsCache.delete(key);
+        }
+
+        resultsCache.set(key, results);
+        return results;
+    };
+
+    const prefetchResults = function ($elements) {
+        const batches = {};
+
+        $elements.each(function (i, element) {
+            if (!element.dataset.batchUrl || getPrefetchKey(element) in prefetchedResults) {
+                return;
+            }
+            const batchKey = [element.dataset.batchUrl, element.dataset.actionName].join(' ');
+            batches[batchKey] = batches[batchKey] || {
+                url: element.dataset.batchUrl,
+                actionName: element.dataset.actionName,
+                fields: new Set(),
+            };
+            batches[batchKey].fields.add(getFieldKey(element));
+        });
+
+        $.each(batches, function (batchKey, batch) {
+            const fields = Array.from(batch.fields);
+            const request = $.ajax({
+                url: batch.url,
+                type: 'GET',
+                traditional: true,
+                data: {action_name: batch.actionName, field: fields},
+            });
+            fields.forEach((field) => {
+                prefetchedResults[batchKey + ' ' + field] = request.then((data) => data.results[field]);
+            });
+        });
+    };
+
     $.fn.djangoAdminActionFormSelect2 = function () {
         $.each(this, function (i, element) {
+            // Request data of the page following the last displayed one, if there is one
+            let nextPageData = null;
+
             $(element).select2({
                 ajax: {
+                    transport: (params, success, failure) => {
+                        const prefetched = prefetchedResults[getPrefetchKey(element)];
+                        const request = () => fetchResults(params.url, params.data);
+                        let aborted = false;
+
+                        const results = (
+                            prefetched === undefined || params.data.term || params.data.page || params.data.cursor
+                                ? request()
+                                // Failed batch request is retried as a regular request for the field
+                                : prefetched.then((data) => data || request(), request)
+                        );
+                        results.then(
+                            (data) => aborted || success(data),
+                            () => aborted || failure(),
+                        );
+
+                        // Select2 aborts the request when the search term changes, so outdated results are not displayed
+                        return {abort: () => { aborted = true; }};
+                    },
                     data: (params) => {
-                        return {
+                        return getRequestData(element, params);
+                    },
+                    processResults: (data, params) => {
+                        // Select2 copies params of the last request when loading more results,
+                        // so the cursor is passed to the request for the next page
+                        params.cursor = data.pagination.cursor;
+                        nextPageData = data.pagination.more ? getRequestData(element, {
                             term: params.term,
-                            page: params.page,
-                            action_name: element.dataset.actionName,
-                            field_name: element.dataset.fieldName,
-                            inline_name: element.dataset.inlineName,
-                        };
+                            page: (params.page || 1) + 1,
+                            cursor: params.cursor,
+                        }) : null;
+                        return data;
                     }
                 }
             });
+
+            const select2 = $(element).data('select2');
+            select2.$results.on('scroll', function () {
+                if (nextPageData !== null) {
+                    fetchResults(element.getAttribute('data-ajax--url'), nextPageData);
+                    nextPageData = null;
+                }
+            });
         });
         return this;
     };
 
     $(function () {
+        // Fields of the template form of inlines are included, as they are used by added forms
+        prefetchResults($('.admin-actionform-autocomplete'));
+
         // Initialize all autocomplete widgets except the one in the template
         // form used when a new formset is added.
         $('.admin-actionform-autocomplete').not('[name*=__prefix__]').djangoAdminActionFormSelect2();
@@ -0,0 +1,55 @@
+// Loads consecutive pages of objects listed on the action form page when `Meta.list_objects_limit` is set.
+// Selection is sent in the same format as when the form is submitted, and changelist filters are passed
+// in the query string, so that the server can recreate the queryset passed to the action.
+
+'use strict';
+{
+    function loadMoreObjects(event) {
+        event.preventDefault();
+
+        const button = event.target;
+        const pagination = button.closest('.action-form-objects-pagination');
+        const list = document.querySelector('.action-form-objects');
+        const shown = pagination.querySelector('.action-form-objects-shown');
+        const form = document.querySelector('.action-form form');
+
+        const data = new FormData();
+        for (const name of ['csrfmiddlewaretoken', 'action', 'select_across', '_selected_action']) {
+            for (const input of form.querySelectorAll(`input[type=hidden][name=${name}]`)) {
+                data.append(name, input.value);
+            }
+        }
+        const page = parseInt(pagination.dataset.page || '1') + 1;
+        data.append('page', page);
+
+        button.classList.add('disabled');
+
+        fetch(pagination.dataset.url + window.location.search, {method: 'POST', body: data})
+            .then((response) => response.json())
+            .then((data) => {
+                for (const object of data.results) {
+                    const item = document.createElement('li');
+                    const link = document.createElement('a');
+                    link.href = object.url;
+                    link.textContent = object.text;
+                    item.append(`${pagination.dataset.verboseName}: `, link);
+                    list.append(item);
+                }
+                pagination.dataset.page = page;
+                shown.textContent = list.children.length;
+
+                if (data.pagination.more) {
+                    button.classList.remove('disabled');
+                } else {
+                    button.remove();
+                }
+            })
+            .catch(() => button.classList.remove('disabled'));
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        for (const button of document.querySelectorAll('.action-form-objects-more')) {
+            button.addEventListener('click', loadMoreObjects);
+        }
+    });
+}
@@ -0,0 +1,42 @@
+// Polls progress of the action executed in background and updates the task status page,
+// until the task is finished or failed.
+
+'use strict';
+{
+    const POLL_INTERVAL = 1000;
+
+    function updateProgress(container) {
+        fetch(container.dataset.url)
+            .then((response) => response.json())
+            .then((progress) => {
+                container.dataset.status = progress.status;
+                container.querySelector('.action-task-status').textContent = progress.status_display;
+
+                const progressBar = container.querySelector('progress');
+                progressBar.max = progress.total;
+                progressBar.value = progress.processed;
+                container.querySelector('.action-task-counter').textContent = `${progress.processed} / ${progress.total}`;
+
+                const messageList = container.querySelector('.messagelist');
+                messageList.replaceChildren(...progress.messages.map((message) => {
+                    const item = document.createElement('li');
+                    item.className = message.level;
+                    item.textContent = message.message;
+                    return item;
+                }));
+
+                if (progress.status === 'pending' || progress.status === 'running') {
+                    setTimeout(updateProgress, POLL_INTERVAL, container);
+                }
+            })
+            .catch(() => setTimeout(updateProgress, POLL_INTERVAL, container));
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        for (const container of document.querySelectorAll('.action-task-progress')) {
+            if (container.dataset.status === 'pending' || container.dataset.status === 'running') {
+                setTimeout(updateProgress, POLL_INTERVAL, container);
+            }
+        }
+    });
+}
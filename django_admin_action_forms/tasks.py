@@ -0,0 +1,398 @@
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+    from django.contrib.admin import AdminSite, ModelAdmin
+
+    from .locks import LockBackend
+
+import logging
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.admin.sites import all_sites
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.base import Message
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import QuerySet
+from django.http import HttpRequest, QueryDict
+from django.utils.translation import gettext_lazy
+
+logger = logging.getLogger(__name__)
+
+
+class TaskMessageDict(TypedDict):
+    level: str
+    message: str
+
+
+class TaskProgressDict(TypedDict):
+    action: str
+    status: str
+    status_display: str
+    processed: int
+    total: int
+    messages: "list[TaskMessageDict]"
+
+
+class MessagesCollector(list):
+    """
+    Replaces `request._messages` in background tasks, so that messages sent by the action
+    using `ModelAdmin.message_user()` can be displayed on the task status page.
+    """
+
+    def add(self, level: int, message: str, extra_tags: str = "") -> None:
+        self.append(Message(level, message, extra_tags))
+
+
+def get_registered_modeladmin(
+    admin_site_name: str, app_label: str, model_name: str
+) -> "ModelAdmin":
+    admin_site: "AdminSite" = next(
+        site for site in all_sites if site.name == admin_site_name
+    )
+
+    return next(
+        modeladmin
+        for model, modeladmin in admin_site._registry.items()
+        if model._meta.app_label == app_label and model._meta.model_name == model_name
+    )
+
+
+def get_registered_action(
+    modeladmin: "ModelAdmin", request: HttpRequest, action_name: str
+) -> "Callable[..., Any]":
+    action, _, _ = modeladmin.get_actions(request)[action_name]
+    return action
+
+
+def get_post_data(request: HttpRequest) -> "dict[str, list[str]]":
+    """
+    Returns data submitted with the action form, which can be stored and used to recreate the request later.
+    """
+    return {
+        key: request.POST.getlist(key)
+        for key in request.POST
+        if key != "csrfmiddlewaretoken"
+    }
+
+
+def get_action_request(
+    user_pk: Any,
+    messages: MessagesCollector,
+    post_data: "dict[str, list[str]] | None" = None,
+    query_string: str = "",
+) -> HttpRequest:
+    """
+    Returns a request for calling the action outside of the request that submitted the form,
+    collecting messages sent by the action in `messages`.
+
+    When `post_data` and `query_string` are given, the request is equivalent to the one that submitted the form.
+    """
+    request = HttpRequest()
+    request.method = "POST"
+    request.user = get_user_model()._default_manager.get(pk=user_pk)
+    request._messages = messages
+    request.GET = QueryDict(query_string)
+    request.POST = QueryDict(mutable=True)
+    for key, values in (post_data or {}).items():
+        request.POST.setlist(key, values)
+    return request
+
+
+def get_submitted_action_data(
+    action: "Callable[..., Any]",
+    modeladmin: "ModelAdmin",
+    action_name: str,
+    request: HttpRequest,
+) -> "tuple[QuerySet, dict[str, Any]]":
+    """
+    Recreates the queryset and validates the form of the action using data of the request,
+    returning the queryset and cleaned data passed to the action.
+    """
+    from .views import get_action_queryset
+
+    queryset = get_action_queryset(modeladmin, request)
+
+    form = action.form_class(
+        modeladmin, action_name, request, queryset, data=request.POST
+    )
+
+    if not (form.is_valid() and form.inlines_are_valid()):
+        raise ValidationError(
+            "Submitted form data is no longer valid: %s" % form.errors
+        )
+
+    return queryset, {**form.cleaned_data, **form.inlines_cleaned_data}
+
+
+class ActionTask:
+    """
+    Action with submitted form data, executed in background by an `ActionExecutor`.
+
+    Task stores only the submitted form data and query string of the changelist, and the queryset and cleaned data
+    of the form are recreated when the task is run, like when resuming a checkpoint.
+
+    Task and its progress are stored in the default cache, so it has to be shared between
+    processes serving the admin and processes executing the tasks.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+
+    STATUS_DISPLAY = {
+        PENDING: gettext_lazy("Queued"),
+        RUNNING: gettext_lazy("In progress"),
+        FINISHED: gettext_lazy("Finished"),
+        FAILED: gettext_lazy("Failed"),
+    }
+
+    cache_key_prefix: str = "django_admin_action_forms.task"
+    cache_timeout: int = 24 * 60 * 60
+
+    def __init__(
+        self,
+        admin_site_name: str,
+        app_label: str,
+        model_name: str,
+        action: str,
+        user_pk: Any,
+        post_data: "dict[str, list[str]]",
+        query_string: str = "",
+        total: int = 0,
+        task_id: "str | None" = None,
+    ):
+        self.id = task_id or uuid.uuid4().hex
+        self.admin_site_name = admin_site_name
+        self.app_label = app_label
+        self.model_name = model_name
+        self.action = action
+        self.user_pk = user_pk
+        self.post_data = post_data
+        self.query_string = query_string
+
+        self.checkpoint_id: "str | None" = None
+        self.lock: Any = None
+        self.lock_backend: "LockBackend | None" = None
+
+        self.status = self.PENDING
+        self.processed = 0
+        self.total = total
+        self.messages = MessagesCollector()
+
+    @classmethod
+    def from_action(
+        cls,
+        modeladmin: "ModelAdmin",
+        action: str,
+        request: HttpRequest,
+        queryset: QuerySet,
+    ) -> "ActionTask":
+        return cls(
+            admin_site_name=modeladmin.admin_site.name,
+            app_label=modeladmin.opts.app_label,
+            model_name=modeladmin.opts.model_name,
+            action=action,
+            user_pk=request.user.pk,
+            post_data=get_post_data(request),
+            query_string=request.GET.urlencode(),
+            total=queryset.count(),
+        )
+
+    @classmethod
+    def get_cache_key(cls, task_id: str) -> str:
+        return f"{cls.cache_key_prefix}.{task_id}"
+
+    @classmethod
+    def get(cls, task_id: str) -> "ActionTask | None":
+        """
+        Returns the task stored by `save()`, e.g. in a worker which received only its id.
+        """
+        stored = cache.get(cls.get_cache_key(task_id))
+
+        if stored is None:
+            return None
+
+        task = cls(**stored["task"], task_id=task_id)
+        task.checkpoint_id = stored["checkpoint_id"]
+        task.lock = stored["lock"]
+        task.lock_backend = stored["lock_backend"]
+        task.status = stored["progress"]["status"]
+        task.processed = stored["progress"]["processed"]
+        return task
+
+    @classmethod
+    def get_progress(cls, task_id: str, user_pk: Any) -> "TaskProgressDict | None":
+        """
+        Returns progress of the task, or `None` if it does not exist or was submitted by another user.
+        """
+        stored = cache.get(cls.get_cache_key(task_id))
+
+        if stored is None or stored["user"] != user_pk:
+            return None
+
+        return stored["progress"]
+
+    def save(self) -> None:
+        cache.set(
+            self.get_cache_key(self.id),
+            {
+                "user": self.user_pk,
+                "task": {
+                    "admin_site_name": self.admin_site_name,
+                    "app_label": self.app_label,
+                    "model_name": self.model_name,
+                    "action": self.action,
+                    "user_pk": self.user_pk,
+                    "post_data": self.post_data,
+                    "query_string": self.query_string,
+                    "total": self.total,
+                },
+                "checkpoint_id": self.checkpoint_id,
+                "lock": self.lock,
+                "lock_backend": self.lock_backend,
+                "progress": {
+                    "action": self.action,
+                    "status": self.status,
+                    "status_display": str(self.STATUS_DISPLAY[self.status]),
+                    "processed": self.processed,
+                    "total": self.total,
+                    "messages": [
+                        {"level": message.level_tag, "message": str(message)}
+                        for message in self.messages
+                    ],
+                },
+            },
+            self.cache_timeout,
+        )
+
+    def update_progress(self, processed: int, total: "int | None" = None) -> None:
+        """
+        Can be called by the action, using `request.action_task`, to report its progress.
+        """
+        self.processed = processed
+        if total is not None:
+            self.total = total
+        self.save()
+
+    def get_modeladmin(self) -> "ModelAdmin":
+        return get_registered_modeladmin(
+            self.admin_site_name, self.app_label, self.model_name
+        )
+
+    def get_request(self) -> HttpRequest:
+        """
+        Returns a request passed to the action, equivalent to the one that submitted the form,
+        as the original request is already finished.
+        """
+        request = get_action_request(
+            self.user_pk, self.messages, self.post_data, self.query_string
+        )
+        request.action_task = self
+        return request
+
+    def release_lock(self) -> None:
+        """
+        Releases the slot acquired when the form was submitted, which is held until the task is finished.
+        """
+        if self.lock is not None and self.lock_backend is not None:
+            self.lock_backend.release(self.lock)
+        self.lock = None
+
+    def fail(self) -> None:
+        """
+        Marks the task as failed without running it, e.g. when it could not be submitted to the executor.
+        """
+        self.status = self.FAILED
+        self.release_lock()
+        self.save()
+
+    def run(self) -> None:
+        self.status = self.RUNNING
+        self.save()
+
+        try:
+            modeladmin = self.get_modeladmin()
+            request = self.get_request()
+
+            action = get_registered_action(modeladmin, request, self.action)
+            queryset, data = get_submitted_action_data(
+                action, modeladmin, self.action, request
+            )
+
+            checkpoint = (
+                action.checkpoint_store.get(self.checkpoint_id)
+                if self.checkpoint_id is not None
+                else None
+            )
+
+            action.call_action(
+                modeladmin, request, self.action, (queryset,), data, checkpoint
+            )
+        except Exception:
+            logger.exception(
+                "Action '%s' failed in background task %s", self.action, self.id
+            )
+            self.status = self.FAILED
+        else:
+            self.status = self.FINISHED
+            self.processed = max(self.processed, self.total)
+        finally:
+            # Released even when the action could not be found, e.g. because permissions of the user changed
+            self.release_lock()
+
+        self.save()
+
+
+class ActionExecutor:
+    """
+    Base class for executors running actions in background.
+
+    Subclasses should arrange for `task.run()` to be called outside of the request, e.g. in a Celery or RQ worker,
+    which can receive only `task.id` and load the task using `ActionTask.get()`.
+    """
+
+    def submit(self, task: ActionTask) -> None:
+        raise NotImplementedError(
+            "Subclasses of ActionExecutor must provide a submit() method."
+        )
+
+
+class ThreadPoolActionExecutor(ActionExecutor):
+    """
+    Runs actions in a thread pool inside the process that served the request.
+    """
+
+    def __init__(self, max_workers: "int | None" = None):
+        self.max_workers = max_workers
+        self._executor: "ThreadPoolExecutor | None" = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="django_admin_action_forms",
+                )
+            return self._executor
+
+    @staticmethod
+    def _run(task: ActionTask) -> None:
+        try:
+            task.run()
+        finally:
+            # Connections are opened per thread and would otherwise be left open
+            connections.close_all()
+
+    def submit(self, task: ActionTask) -> None:
+        self.executor.submit(self._run, task)
+
+
+default_executor = ThreadPoolActionExecutor()
@@ -0,0 +1,57 @@
+from django import template
+from django.template.base import FilterExpression, NodeList, Parser, Token
+
+from ..fragments import get_cached_fragment
+
+register = template.Library()
+
+
+class CachedFragmentNode(template.Node):
+    def __init__(
+        self,
+        nodelist: NodeList,
+        key: FilterExpression,
+        vary_on: "list[FilterExpression]",
+    ):
+        self.nodelist = nodelist
+        self.key = key
+        self.vary_on = vary_on
+
+    def render(self, context: template.Context) -> str:
+        key = self.key.resolve(context)
+
+        # Fragments which depend on more than the key, e.g. submitted data, are not cached
+        if key is None:
+            return self.nodelist.render(context)
+
+        return get_cached_fragment(
+            (*key, *(var.resolve(context) for var in self.vary_on)),
+            lambda: self.nodelist.render(context),
+        )
+
+
+@register.tag("cachedfragment")
+def do_cachedfragment(parser: Parser, token: Token) -> CachedFragmentNode:
+    """
+    Caches the enclosed fragment of a template in memory, for the key and optional values it varies on::
+
+        {% cachedfragment inline_action_formset.fragment_cache_key "head" %}
+            ...
+        {% endcachedfragment %}
+
+    The fragment is rendered every time if the key is `None`.
+    """
+    nodelist = parser.parse(("endcachedfragment",))
+    parser.delete_first_token()
+
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            "'%s' tag requires at least 1 argument." % bits[0]
+        )
+
+    return CachedFragmentNode(
+        nodelist,
+        parser.compile_filter(bits[1]),
+        [parser.compile_filter(bit) for bit in bits[2:]],
+    )
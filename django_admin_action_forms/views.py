@@ -1,16 +1,206 @@
+import hashlib
+import json
+import math
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+from asgiref.sync import sync_to_async
+
+from django import VERSION as DJANGO_VERSION
 from django.contrib.admin import ModelAdmin
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.admin.options import IS_POPUP_VAR, IncorrectLookupParameters
 from django.db.models import Model, QuerySet
 from django.forms import Field, ModelChoiceField, ModelMultipleChoiceField
 from django.http import (
+    Http404,
     HttpRequest,
+    HttpResponse,
     HttpResponseBadRequest,
     HttpResponseForbidden,
+    HttpResponseRedirect,
     JsonResponse,
 )
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.utils.translation import get_language
+from django.views.generic import View
 from django.views.generic.list import BaseListView
 
+from .autocomplete import (
+    AutocompleteLabel,
+    AutocompleteResultsCache,
+    InvalidCursor,
+    filter_after_cursor,
+    get_cursor,
+    get_keyset_ordering,
+    get_search_results,
+    order_by_keyset,
+)
+from .checkpoints import resume_checkpoint
 from .forms import ActionForm
+from .fragments import get_permissions_key
 from .formsets import InlineAdminActionFormSet
+from .tasks import ActionTask
+
+# Actions of model admins before checking permissions, rebuilt when actions of the model admin or the admin site change
+_actions_index: (
+    "WeakKeyDictionary[ModelAdmin, tuple[Any, dict[str, tuple[Callable, str, str]]]]"
+) = WeakKeyDictionary()
+# Fields of action forms and their inlines, which are defined on the form classes
+_form_fields_index: "WeakKeyDictionary[type[ActionForm], dict[tuple[str | None, str], tuple[type[ActionForm], Field]]]" = (WeakKeyDictionary())
+
+
+def _get_actions_index(
+    model_admin: ModelAdmin,
+) -> "dict[str, tuple[Callable, str, str]]":
+    actions_key = (
+        tuple(model_admin.actions or ()),
+        tuple(model_admin.admin_site.actions),
+    )
+
+    cached = _actions_index.get(model_admin)
+
+    if cached is None or cached[0] != actions_key:
+        cached = (
+            actions_key,
+            {
+                name: (func, name, description)
+                for func, name, description in model_admin._get_base_actions()
+            },
+        )
+        _actions_index[model_admin] = cached
+
+    return cached[1]
+
+
+def get_action(
+    model_admin: ModelAdmin, request: HttpRequest, action_name: str
+) -> "tuple[Callable, str, str] | None":
+    """
+    Equivalent of `model_admin.get_actions(request).get(action_name)`, which checks permissions
+    only for the requested action instead of building all of them.
+    """
+
+    # Actions might depend on the request, so the index cannot be used
+    if type(model_admin).get_actions is not ModelAdmin.get_actions:
+        return model_admin.get_actions(request).get(action_name)
+
+    if model_admin.actions is None or IS_POPUP_VAR in request.GET:
+        return None
+
+    action = _get_actions_index(model_admin).get(action_name)
+
+    if action is None or not model_admin._filter_actions_by_permissions(
+        request, [action]
+    ):
+        return None
+
+    return action
+
+
+def get_action_form_class(
+    model_admin: ModelAdmin, request: HttpRequest, action_name: str
+) -> "type[ActionForm] | None":
+    """
+    Returns the form class of the action with the given name, or `None` if the action
+    does not exist, is not available for the user or was not created using `@action_with_form`.
+    """
+
+    # ModelAdmin -> Action
+    action = get_action(model_admin, request, action_name)
+
+    if action is None:
+        return None
+
+    # Action -> ActionForm
+    action_form = getattr(action[0], "form_class", None)
+
+    if action_form is None or not issubclass(action_form, ActionForm):
+        return None
+
+    return action_form
+
+
+def _get_form_fields_index(
+    form: "type[ActionForm]",
+) -> "dict[tuple[str | None, str], tuple[type[ActionForm], Field]]":
+    index = _form_fields_index.get(form)
+
+    if index is None:
+        # Fields on the action form
+        index = {
+            (None, name): (form, field) for name, field in form.base_fields.items()
+        }
+
+        # Fields on the inlines, first inline with the given name is used
+        form_meta: "ActionForm.Meta | None" = getattr(form, "Meta", None)
+        inlines: "list[InlineAdminActionFormSet]" = getattr(form_meta, "inlines", [])
+        inline_names = set()
+
+        for inline in inlines:
+            if inline.name in inline_names:
+                continue
+            inline_names.add(inline.name)
+
+            for name, field in inline.form.base_fields.items():
+                index[(inline.name, name)] = (inline.form, field)
+
+        _form_fields_index[form] = index
+
+    return index
+
+
+def get_action_form_field(
+    form: "type[ActionForm]", field_name: str, inline_name: "str | None" = None
+) -> "Field | None":
+    """
+    Returns the field of the action form, or of its inline with the given name.
+    """
+    form_and_field = _get_form_fields_index(form).get((inline_name, field_name))
+    return form_and_field[1] if form_and_field is not None else None
+
+
+def get_action_form_field_form(
+    form: "type[ActionForm]", field_name: str, inline_name: "str | None" = None
+) -> "type[ActionForm] | None":
+    """
+    Returns the form class declaring the field, which is the action form or the form of its inline.
+    """
+    form_and_field = _get_form_fields_index(form).get((inline_name, field_name))
+    return form_and_field[0] if form_and_field is not None else None
+
+
+def get_action_queryset(model_admin: ModelAdmin, request: HttpRequest) -> QuerySet:
+    """
+    Recreates the queryset passed to the action, in the same way as `ModelAdmin.response_action` does.
+    Filters of the changelist are expected to be passed in the query string.
+    """
+    if request.POST.get("select_across", "0") == "0":
+        return model_admin.get_queryset(request).filter(
+            pk__in=request.POST.getlist(ACTION_CHECKBOX_NAME)
+        )
+
+    changelist = model_admin.get_changelist_instance(request)
+    return changelist.get_queryset(request)
+
+
+class AutocompleteQuery(NamedTuple):
+    """
+    Queryset of objects matching the search term, prepared by `ActionFormAutocompleteJsonView.get_query()`.
+
+    If `ordering` is set, results are fetched using keyset pagination, otherwise the page `page_nr` is fetched.
+    """
+
+    queryset: QuerySet
+    ordering: "list[tuple[str, bool]] | None"
+    page_nr: int
+    label: "AutocompleteLabel | None"
+    results_cache: "AutocompleteResultsCache | None"
+    results_key: "str | None"
 
 
 class ActionFormAutocompleteJsonView(BaseListView):
@@ -21,6 +211,9 @@ class ActionFormAutocompleteJsonView(BaseListView):
 
     paginate_by: int = 20
     model_admin: "ModelAdmin | None" = None
+    # Whether the view returns first pages of results of several fields, see `get_batch()`
+    batch: bool = False
+    max_batch_size: int = 50
 
     def _get_field_by_name(
         self,
@@ -28,35 +221,98 @@ class ActionFormAutocompleteJsonView(BaseListView):
         field_name: str,
         inline_name: "str | None" = None,
     ) -> "Field | None":
+        return get_action_form_field(form, field_name, inline_name)
 
-        # Fields on the action form
-        if inline_name is None:
-            return form.base_fields.get(field_name, None)
+    def get(self, request: HttpRequest):
+        """
+        Handles autocomplete requests made by the `AutocompleteModelChoiceWidget` and `AutocompleteModelMultiChoiceWidget` widgets.
 
-        # Fields on the inline
-        form_meta: "ActionForm.Meta | None" = getattr(form, "Meta", None)
-        if form_meta is None:
-            return None
+        Depending on GET parameters and user permissions may return a `400 Bad Request`, `403 Forbidden`, or `200 OK` response
+        with a JSON object containing the results and pagination information.
 
-        inlines: "list[InlineAdminActionFormSet]" = getattr(form_meta, "inlines", [])
+        Returned objects are filtered from `queryset` specified on field and restricted by the `limit_choices_to` attribute.
+        """
+        if self.batch:
+            return self.get_batch(request)
 
-        for inline in inlines:
-            if inline.name != inline_name:
-                continue
+        query = self.get_query(request)
 
-            return inline.form.base_fields.get(field_name, None)
+        if isinstance(query, HttpResponse):
+            return query
 
-        return None
+        if query.results_cache is None:
+            return JsonResponse(self.get_results(request, query))
 
-    def get(self, request: HttpRequest):
+        results = self.get_cached_results(request, query)
+
+        return self.get_cached_response(request, results, query.results_cache)
+
+    def get_batch(self, request: HttpRequest):
         """
-        Handles autocomplete requests made by the `AutocompleteModelChoiceWidget` and `AutocompleteModelMultiChoiceWidget` widgets.
+        Handles requests made by `action_form_autocomplete.js` when the action form page is loaded,
+        returning a JSON object with the first page of results of each requested field, keyed by the `field` parameter.
+        """
+        queries = self.get_batch_queries(request)
 
-        Depending on GET parameters and user permissions may return a `400 Bad Request`, `403 Forbidden`, or `200 OK` response
-        with a JSON object containing the results and pagination information.
+        if isinstance(queries, HttpResponse):
+            return queries
 
-        Returned objects are filtered from `queryset` specified on field and restricted by the `limit_choices_to` attribute.
+        return JsonResponse(
+            {
+                "results": {
+                    key: self.get_cached_results(request, query)
+                    for key, query in queries.items()
+                }
+            }
+        )
+
+    def get_batch_queries(
+        self, request: HttpRequest
+    ) -> "dict[str, AutocompleteQuery] | HttpResponse":
+        """
+        Prepares queries for the first page of results without a search term for each `field` GET parameter,
+        which is a field name, or an inline name and a field name joined by a dot.
         """
+        keys = list(dict.fromkeys(request.GET.getlist("field")))
+
+        if not keys or len(keys) > self.max_batch_size:
+            return HttpResponseBadRequest()
+
+        queries: "dict[str, AutocompleteQuery]" = {}
+
+        for key in keys:
+            inline_name, _, field_name = key.rpartition(".")
+            query = self.get_query(
+                request,
+                {
+                    "action_name": request.GET.get("action_name"),
+                    "field_name": field_name,
+                    "inline_name": inline_name,
+                },
+            )
+
+            if isinstance(query, HttpResponse):
+                return query
+
+            queries[key] = query
+
+        return queries
+
+    def get_query(
+        self, request: HttpRequest, params: "Mapping[str, Any] | None" = None
+    ) -> "AutocompleteQuery | HttpResponse":
+        """
+        Checks permissions and prepares the queryset of objects matching the search term,
+        or returns a `400 Bad Request` or `403 Forbidden` response.
+
+        Parameters are read from `params`, which defaults to GET parameters of the request.
+
+        When the ordering of objects allows it, pages are fetched using keyset pagination, which does not count
+        the objects and fetches objects following the `cursor` returned with the previous page instead of using `OFFSET`.
+        """
+        if params is None:
+            params = request.GET
+
         if self.model_admin is None:
             raise ValueError(
                 "model_admin attribute must be set to a ModelAdmin instance."
@@ -65,11 +321,12 @@ class ActionFormAutocompleteJsonView(BaseListView):
         if not request.user.is_staff:
             return HttpResponseForbidden()
 
-        action_name = request.GET.get("action_name")
-        field_name = request.GET.get("field_name")
-        inline_name = request.GET.get("inline_name")
-        page_nr = int(request.GET.get("page", "1"))
-        term = request.GET.get("term", "")
+        action_name = params.get("action_name")
+        field_name = params.get("field_name")
+        inline_name = params.get("inline_name") or None
+        page_nr = int(params.get("page", "1"))
+        cursor = params.get("cursor") or None
+        term = params.get("term", "")
 
         if action_name is None or field_name is None:
             return HttpResponseBadRequest()
@@ -77,16 +334,10 @@ class ActionFormAutocompleteJsonView(BaseListView):
         if not self.model_admin.has_view_permission(request):
             return HttpResponseForbidden()
 
-        # ModelAdmin -> Action
-        try:
-            action, _, _ = self.model_admin.get_actions(request).get(action_name)
-        except TypeError:
-            return HttpResponseBadRequest()
-
-        # Action -> ActionForm
-        action_form = getattr(action, "form_class", None)
+        # ModelAdmin -> Action -> ActionForm
+        action_form = get_action_form_class(self.model_admin, request, action_name)
 
-        if action_form is None or not issubclass(action_form, ActionForm):
+        if action_form is None:
             return HttpResponseBadRequest()
 
         # ActionForm -> Field
@@ -95,9 +346,21 @@ class ActionFormAutocompleteJsonView(BaseListView):
         if not isinstance(field, (ModelChoiceField, ModelMultipleChoiceField)):
             return HttpResponseBadRequest()
 
+        # Labels, search and read database are declared on the form of the field, which might be the form of an inline
+        field_form_meta: "ActionForm.Meta | None" = getattr(
+            get_action_form_field_form(action_form, field_name, inline_name),
+            "Meta",
+            None,
+        )
+
         # Field -> QuerySet
         queryset: "QuerySet[Model]" = field.queryset
 
+        read_database = getattr(field_form_meta, "read_database", None)
+
+        if read_database is not None:
+            queryset = queryset.using(read_database)
+
         limit_choices_to = field.get_limit_choices_to()
 
         if limit_choices_to is not None:
@@ -110,23 +373,416 @@ class ActionFormAutocompleteJsonView(BaseListView):
         if queryset_modeladmin is None:
             return HttpResponseBadRequest()
 
-        queryset, may_have_duplicates = queryset_modeladmin.get_search_results(
-            request, queryset, term
+        label: "AutocompleteLabel | None" = getattr(
+            field_form_meta, "autocomplete_labels", {}
+        ).get(field_name)
+        search_fields = getattr(field_form_meta, "autocomplete_search_fields", {}).get(
+            field_name
         )
 
+        # QuerySet -> Search results
+        if search_fields is not None:
+            queryset, may_have_duplicates = get_search_results(
+                request, queryset, term, search_fields
+            )
+        else:
+            queryset, may_have_duplicates = queryset_modeladmin.get_search_results(
+                request, queryset, term
+            )
+
         if may_have_duplicates:
             queryset = queryset.distinct()
 
         if not queryset.ordered:
             queryset = queryset.order_by("pk")
 
+        ordering = get_keyset_ordering(queryset)
+
+        if label is not None:
+            queryset = label.get_values(queryset, *(name for name, _ in ordering or ()))
+
+        # Requests for pages other than the first one without a cursor are made by outdated scripts
+        if ordering is not None and (cursor is not None or page_nr == 1):
+            queryset = order_by_keyset(queryset, ordering)
+
+            if cursor is not None:
+                try:
+                    queryset = filter_after_cursor(queryset, ordering, cursor)
+                except InvalidCursor:
+                    return HttpResponseBadRequest()
+        elif cursor is not None:
+            return HttpResponseBadRequest()
+        else:
+            ordering = None
+
+        form_meta: "ActionForm.Meta | None" = getattr(action_form, "Meta", None)
+        cache_timeout = getattr(form_meta, "autocomplete_cache_timeout", None)
+
+        if cache_timeout is None:
+            return AutocompleteQuery(queryset, ordering, page_nr, label, None, None)
+
+        results_cache = AutocompleteResultsCache(
+            "%s.%s.%s.%s"
+            % (
+                self.model_admin.admin_site.name,
+                self.model_admin.opts.app_label,
+                self.model_admin.opts.model_name,
+                action_name,
+            ),
+            cache_timeout,
+            getattr(form_meta, "autocomplete_cache_max_entries", 1000),
+        )
+
+        # Results depend on permissions of the user through ModelAdmin.get_search_results()
+        results_key = json.dumps(
+            [
+                inline_name,
+                field_name,
+                term,
+                page_nr,
+                cursor,
+                get_language(),
+                repr(limit_choices_to),
+                get_permissions_key(request.user),
+            ]
+        )
+
+        return AutocompleteQuery(
+            queryset, ordering, page_nr, label, results_cache, results_key
+        )
+
+    def get_cached_results(
+        self, request: HttpRequest, query: AutocompleteQuery
+    ) -> "dict[str, Any]":
+        if query.results_cache is None:
+            return self.get_results(request, query)
+
+        return query.results_cache.get_or_set(
+            query.results_key, lambda: self.get_results(request, query)
+        )
+
+    def get_results(
+        self, request: HttpRequest, query: AutocompleteQuery
+    ) -> "dict[str, Any]":
+        """
+        Returns the page of objects matching the search term, in a format expected by Select2.
+        """
+        if query.ordering is not None:
+            # Fetching one more object tells whether there is a next page without counting all of them
+            objects = list(query.queryset[: self.paginate_by + 1])
+            return self.serialize_results(objects, query)
+
         # QuerySet -> Paginator & Page
-        paginator = self.model_admin.get_paginator(request, queryset, self.paginate_by)
-        page = paginator.get_page(page_nr)
+        paginator = self.model_admin.get_paginator(
+            request, query.queryset, self.paginate_by
+        )
+        page = paginator.get_page(query.page_nr)
+
+        return {
+            "results": [self.serialize_result(obj, query.label) for obj in page],
+            "pagination": {"more": page.has_next()},
+        }
+
+    def serialize_results(
+        self, objects: "list[Model | dict[str, Any]]", query: AutocompleteQuery
+    ) -> "dict[str, Any]":
+        has_more = len(objects) > self.paginate_by
+        objects = objects[: self.paginate_by]
+
+        return {
+            "results": [self.serialize_result(obj, query.label) for obj in objects],
+            "pagination": {
+                "more": has_more,
+                "cursor": get_cursor(objects[-1], query.ordering) if has_more else None,
+            },
+        }
+
+    @staticmethod
+    def serialize_result(
+        obj: "Model | dict[str, Any]", label: "AutocompleteLabel | None" = None
+    ) -> "dict[str, str]":
+        if label is not None:
+            return {"id": str(obj["pk"]), "text": label.get_label(obj)}
+
+        return {"id": str(obj.pk), "text": str(obj)}
+
+    @staticmethod
+    def get_cached_response(
+        request: HttpRequest,
+        results: "dict[str, Any]",
+        results_cache: AutocompleteResultsCache,
+    ) -> HttpResponse:
+        response = JsonResponse(results)
+        response["ETag"] = quote_etag(hashlib.sha256(response.content).hexdigest())
+        patch_cache_control(response, private=True, max_age=results_cache.timeout)
+
+        return get_conditional_response(
+            request, etag=response["ETag"], response=response
+        )
+
+
+class AsyncActionFormAutocompleteJsonView(ActionFormAutocompleteJsonView):
+    """
+    Variant of `ActionFormAutocompleteJsonView` for projects served using ASGI, which fetches results
+    using the async ORM. Permissions are checked in a single call to a thread, as they might require database queries.
+
+    Requires Django 4.1 or newer. Labels of objects should not require database queries,
+    so `__str__()` should not use related objects, or `Meta.autocomplete_labels` should be used.
+    """
+
+    async def get(self, request: HttpRequest):
+        if self.batch:
+            return await self.aget_batch(request)
+
+        query = await sync_to_async(self.get_query)(request)
+
+        if isinstance(query, HttpResponse):
+            return query
+
+        if query.results_cache is None:
+            return JsonResponse(await self.aget_results(request, query))
+
+        results = await self.aget_cached_results(request, query)
+
+        return self.get_cached_response(request, results, query.results_cache)
+
+    async def aget_batch(self, request: HttpRequest):
+        queries = await sync_to_async(self.get_batch_queries)(request)
+
+        if isinstance(queries, HttpResponse):
+            return queries
+
+        return JsonResponse(
+            {
+                "results": {
+                    key: await self.aget_cached_results(request, query)
+                    for key, query in queries.items()
+                }
+            }
+        )
+
+    async def aget_cached_results(
+        self, request: HttpRequest, query: AutocompleteQuery
+    ) -> "dict[str, Any]":
+        if query.results_cache is None:
+            return await self.aget_results(request, query)
+
+        return await query.results_cache.aget_or_set(
+            query.results_key, lambda: self.aget_results(request, query)
+        )
+
+    async def aget_results(
+        self, request: HttpRequest, query: AutocompleteQuery
+    ) -> "dict[str, Any]":
+        if query.ordering is not None:
+            objects = [obj async for obj in query.queryset[: self.paginate_by + 1]]
+            return self.serialize_results(objects, query)
+
+        count = await query.queryset.acount()
+        num_pages = max(math.ceil(count / self.paginate_by), 1)
+        page_nr = min(max(query.page_nr, 1), num_pages)
+        offset = (page_nr - 1) * self.paginate_by
+
+        objects = [
+            obj async for obj in query.queryset[offset : offset + self.paginate_by]
+        ]
+
+        return {
+            "results": [self.serialize_result(obj, query.label) for obj in objects],
+            "pagination": {"more": page_nr < num_pages},
+        }
+
+
+class ActionFormObjectsJsonView(View):
+    """
+    Returns consecutive pages of objects listed on the action form page when `Meta.list_objects_limit` is set.
+    """
+
+    model_admin: "ModelAdmin | None" = None
+
+    def post(self, request: HttpRequest):
+        """
+        Handles requests made by the "Show more" button below the list of objects.
+
+        Depending on POST parameters and user permissions may return a `400 Bad Request`, `403 Forbidden`, or `200 OK` response
+        with a JSON object containing the objects from requested page and pagination information.
+        """
+        if self.model_admin is None:
+            raise ValueError(
+                "model_admin attribute must be set to a ModelAdmin instance."
+            )
+
+        if not request.user.is_staff:
+            return HttpResponseForbidden()
+
+        action_name = request.POST.get("action")
+
+        try:
+            page_nr = int(request.POST.get("page", "1"))
+        except ValueError:
+            return HttpResponseBadRequest()
+
+        if action_name is None or page_nr < 1:
+            return HttpResponseBadRequest()
+
+        if not self.model_admin.has_view_or_change_permission(request):
+            return HttpResponseForbidden()
+
+        action_form = get_action_form_class(self.model_admin, request, action_name)
+
+        if action_form is None:
+            return HttpResponseBadRequest()
+
+        try:
+            queryset = get_action_queryset(self.model_admin, request)
+        except IncorrectLookupParameters:
+            return HttpResponseBadRequest()
+
+        form = action_form(self.model_admin, action_name, request, queryset)
+
+        if not form.opts.list_objects or form.opts.list_objects_limit is None:
+            return HttpResponseBadRequest()
+
+        objects, objects_have_more = form.get_list_objects_page(page_nr)
+
+        opts = self.model_admin.opts
+        change_url_name = "%s:%s_%s_change" % (
+            self.model_admin.admin_site.name,
+            opts.app_label,
+            opts.model_name,
+        )
 
         return JsonResponse(
             {
-                "results": [{"id": str(obj.pk), "text": str(obj)} for obj in page],
-                "pagination": {"more": page.has_next()},
+                "results": [
+                    {
+                        "id": str(obj.pk),
+                        "text": str(obj),
+                        "url": reverse(change_url_name, kwargs={"object_id": obj.pk}),
+                    }
+                    for obj in objects
+                ],
+                "pagination": {"more": objects_have_more},
             }
         )
+
+
+class ActionFormTaskProgressJsonView(View):
+    """
+    Returns progress of the action executed in background, submitted by the current user.
+    """
+
+    model_admin: "ModelAdmin | None" = None
+
+    def get(self, request: HttpRequest, task_id: str):
+        if not request.user.is_staff:
+            return HttpResponseForbidden()
+
+        progress = ActionTask.get_progress(task_id, request.user.pk)
+
+        if progress is None:
+            raise Http404
+
+        return JsonResponse(progress)
+
+
+class ActionFormTaskView(View):
+    """
+    Displays progress of the action executed in background, updated using `ActionFormTaskProgressJsonView`.
+    """
+
+    template = "django_admin_action_forms/action_task.html"
+    model_admin: "ModelAdmin | None" = None
+
+    def get(self, request: HttpRequest, task_id: str):
+        if self.model_admin is None:
+            raise ValueError(
+                "model_admin attribute must be set to a ModelAdmin instance."
+            )
+
+        if not request.user.is_staff:
+            return HttpResponseForbidden()
+
+        progress = ActionTask.get_progress(task_id, request.user.pk)
+
+        if progress is None:
+            raise Http404
+
+        admin_site = self.model_admin.admin_site
+        opts = self.model_admin.opts
+        action = get_action(self.model_admin, request, progress["action"])
+
+        context = {
+            **admin_site.each_context(request),
+            "title": action[2] if action is not None else progress["action"],
+            "subtitle": None,
+            "app_label": opts.app_config.label,
+            "app_verbose_name": opts.app_config.verbose_name,
+            "model_name": opts.model_name,
+            "model_verbose_name": opts.verbose_name,
+            "model_verbose_name_plural": opts.verbose_name_plural,
+            "action": progress["action"],
+            "progress": progress,
+            "progress_url": reverse(
+                "%s:%s_%s_action_form_task_progress"
+                % (admin_site.name, opts.app_label, opts.model_name),
+                kwargs={"task_id": task_id},
+            ),
+            "django_version_above_6_1_x": (6, 1) <= DJANGO_VERSION,
+        }
+
+        return TemplateResponse(request, self.template, context)
+
+
+class ActionFormCheckpointResumeView(View):
+    """
+    Resumes an interrupted action from the checkpoint, using the "Resume" button on the action form page.
+    """
+
+    model_admin: "ModelAdmin | None" = None
+
+    def post(self, request: HttpRequest):
+        if self.model_admin is None:
+            raise ValueError(
+                "model_admin attribute must be set to a ModelAdmin instance."
+            )
+
+        if not request.user.is_staff:
+            return HttpResponseForbidden()
+
+        action_name = request.POST.get("action")
+        checkpoint_id = request.POST.get("checkpoint")
+
+        if action_name is None or checkpoint_id is None:
+            return HttpResponseBadRequest()
+
+        action = get_action(self.model_admin, request, action_name)
+        checkpoint_store = getattr(action and action[0], "checkpoint_store", None)
+
+        if checkpoint_store is None:
+            return HttpResponseBadRequest()
+
+        checkpoint = checkpoint_store.get(checkpoint_id)
+        opts = self.model_admin.opts
+
+        if (
+            checkpoint is None
+            or str(checkpoint.user_pk) != str(request.user.pk)
+            or checkpoint.action != action_name
+            or checkpoint.app_label != opts.app_label
+            or checkpoint.model_name != opts.model_name
+        ):
+            raise Http404
+
+        response = resume_checkpoint(checkpoint, request)
+
+        if isinstance(response, HttpResponse):
+            return response
+
+        return HttpResponseRedirect(
+            reverse(
+                "%s:%s_%s_changelist"
+                % (self.model_admin.admin_site.name, opts.app_label, opts.model_name)
+            )
+            + (f"?{checkpoint.query_string}" if checkpoint.query_string else "")
+        )
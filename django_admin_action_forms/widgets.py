@@ -1,5 +1,13 @@
 import json
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
+    from .autocomplete import AutocompleteLabel
 
 from django.conf import settings
 from django.contrib.admin.widgets import FilteredSelectMultiple
@@ -48,9 +56,21 @@ class ActionFormAutocompleteMixin(Widget):
     action form autocomplete widgets.
     """
 
-    def __init__(self, attrs=None, choices=()):
+    def __init__(
+        self,
+        attrs=None,
+        choices=(),
+        label: "AutocompleteLabel | None" = None,
+        delay: int = 250,
+        minimum_input_length: int = 0,
+    ):
         super().__init__(attrs)
         self.choices = choices
+        self.label = label
+        self.delay = delay
+        self.minimum_input_length = minimum_input_length
+        # Labels of selected objects loaded by the form, see `ActionForm._load_selected_autocomplete_labels()`
+        self.selected_labels: "dict[str, str] | None" = None
 
     def build_attrs(
         self, base_attrs: "dict[str, Any]", extra_attrs: "dict[str, Any] | None" = None
@@ -59,7 +79,8 @@ class ActionFormAutocompleteMixin(Widget):
         attrs.update(
             {
                 "data-ajax--cache": "true",
-                "data-ajax--delay": 250,
+                "data-ajax--delay": self.delay,
+                "data-minimum-input-length": self.minimum_input_length,
                 "data-ajax--type": "GET",
                 "data-theme": "admin-autocomplete",
                 "data-allow-clear": json.dumps(not self.is_required),
@@ -86,8 +107,13 @@ class ActionFormAutocompleteMixin(Widget):
         if not self.is_required and not self.allow_multiple_selected:
             default[1].append(self.create_option(name, "", "", False, 0))
         choices = (
-            (obj.pk, self.choices.field.label_from_instance(obj))
-            for obj in self.choices.queryset.filter(pk__in=selected_choices)
+            (
+                (pk, label)
+                for pk, label in self.selected_labels.items()
+                if pk in selected_choices
+            )
+            if self.selected_labels is not None
+            else self.get_labels(self.choices.queryset, selected_choices).items()
         )
         for option_value, option_label in choices:
             selected = str(option_value) in value and (
@@ -103,34 +129,57 @@ class ActionFormAutocompleteMixin(Widget):
             )
         return groups
 
+    def get_labels(
+        self, queryset: "QuerySet", pks: "Iterable[str]"
+    ) -> "dict[str, str]":
+        """
+        Returns labels of objects with given primary keys, in order of the queryset.
+        """
+        selected_queryset = queryset.filter(pk__in=pks)
+
+        if self.label is not None:
+            return {
+                str(values["pk"]): self.label.get_label(values)
+                for values in self.label.get_values(selected_queryset)
+            }
+
+        return {
+            str(obj.pk): self.choices.field.label_from_instance(obj)
+            for obj in selected_queryset
+        }
+
     @property
     def media(self):
-        extra = "" if settings.DEBUG else ".min"
+        return _get_autocomplete_media(get_select2_language(), settings.DEBUG)
 
-        select2_language = get_select2_language()
-        i18n_file = (
-            (f"admin/js/vendor/select2/i18n/{select2_language}.js",)
-            if select2_language
-            else ()
-        )
 
-        return Media(
-            js=(
-                "admin/js/vendor/jquery/jquery%s.js" % extra,
-                "admin/js/vendor/select2/select2.full%s.js" % extra,
-            )
-            + i18n_file
-            + (
-                "admin/js/jquery.init.js",
-                "django_admin_action_forms/js/action_form_autocomplete.js",
-            ),
-            css={
-                "screen": (
-                    "admin/css/vendor/select2/select2%s.css" % extra,
-                    "admin/css/autocomplete.css",
-                ),
-            },
+@lru_cache
+def _get_autocomplete_media(select2_language: "str | None", debug: bool) -> Media:
+    extra = "" if debug else ".min"
+
+    i18n_file = (
+        (f"admin/js/vendor/select2/i18n/{select2_language}.js",)
+        if select2_language
+        else ()
+    )
+
+    return Media(
+        js=(
+            "admin/js/vendor/jquery/jquery%s.js" % extra,
+            "admin/js/vendor/select2/select2.full%s.js" % extra,
         )
+        + i18n_file
+        + (
+            "admin/js/jquery.init.js",
+            "django_admin_action_forms/js/action_form_autocomplete.js",
+        ),
+        css={
+            "screen": (
+                "admin/css/vendor/select2/select2%s.css" % extra,
+                "admin/css/autocomplete.css",
+            ),
+        },
+    )
 
 
 class FilterHorizontalSelectMultiple(
@@ -0,0 +1,115 @@
+from django import forms
+from django.contrib import admin
+from django.db.models import F
+
+from django_admin_action_forms import (
+    AdminActionForm,
+    AdminActionFormsMixin,
+    action_with_form,
+)
+from django_admin_action_forms.checkpoints import CacheCheckpointStore
+from django_admin_action_forms.tasks import ActionExecutor
+
+from .models import Category, Product
+
+
+class UserNoteForm(AdminActionForm):
+    note = forms.CharField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if self.request.user.is_superuser:
+            self.fields["note"].initial = f"secret-of-{self.request.user.username}"
+
+
+class CachedUserNoteForm(AdminActionForm):
+    note = forms.CharField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Depends only on permissions of the user, so the rendered fields can be cached
+        if self.request.user.is_superuser:
+            self.fields["note"].label = "Superuser note"
+
+    class Meta:
+        cache_rendered_fields = True
+
+
+class RecordingExecutor(ActionExecutor):
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, task):
+        self.tasks.append(task)
+
+
+class PriceForm(AdminActionForm):
+    price = forms.IntegerField()
+
+
+class ReplicaPriceForm(AdminActionForm):
+    price = forms.IntegerField()
+    category = forms.ModelChoiceField(queryset=Category.objects.all())
+    similar_to = forms.ModelChoiceField(queryset=Category.objects.all(), required=False)
+
+    class Meta:
+        list_objects = True
+        list_objects_limit = 10
+        read_database = "replica"
+        autocomplete_fields = ["similar_to"]
+
+
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    search_fields = ["name"]
+
+
+@admin.register(Product)
+class ProductAdmin(AdminActionFormsMixin, admin.ModelAdmin):
+    actions = [
+        "add_note",
+        "add_cached_note",
+        "set_price_in_chunks",
+        "increase_price_in_processes",
+        "set_price_using_replica",
+        "set_price_in_background",
+    ]
+    search_fields = ["name"]
+
+    @action_with_form(UserNoteForm)
+    def add_note(self, request, queryset, data):
+        pass
+
+    @action_with_form(CachedUserNoteForm)
+    def add_cached_note(self, request, queryset, data):
+        pass
+
+    @action_with_form(PriceForm, chunk_size=2, checkpoint_store=CacheCheckpointStore())
+    def set_price_in_chunks(self, request, queryset, data):
+        queryset.update(price=data["price"])
+
+        if queryset.filter(name="Broken").exists():
+            raise RuntimeError("Broken product")
+
+    @action_with_form(PriceForm, processes=2, chunk_size=2)
+    def increase_price_in_processes(self, request, queryset, data):
+        queryset.update(price=F("price") + data["price"])
+
+        if queryset.filter(name="Broken").exists():
+            raise RuntimeError("Broken product")
+
+        self.message_user(request, "Prices increased.")
+
+    @action_with_form(ReplicaPriceForm)
+    def set_price_using_replica(self, request, queryset, data):
+        self.message_user(
+            request, f"Queryset {queryset.db}, category {data['category']._state.db}."
+        )
+
+    @action_with_form(
+        PriceForm, background=True, executor=RecordingExecutor(), max_concurrent=1
+    )
+    def set_price_in_background(self, request, queryset, data):
+        queryset.update(price=data["price"])
@@ -0,0 +1,26 @@
+"""
+Microbenchmarks of action forms, run as modules from the root of the repository, e.g.::
+
+    python -m tests.benchmarks.form_construction
+"""
+
+import os
+import timeit
+from collections.abc import Callable
+
+
+def setup() -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+    import django
+
+    django.setup()
+
+
+def report(name: str, function: "Callable[[], object]", number: int) -> None:
+    """
+    Prints the best of 5 repeats of `number` calls of `function`, in microseconds per call.
+    """
+    function()
+    best = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(f"{name}: {best * 1e6:.1f} us")
@@ -0,0 +1,63 @@
+"""
+Time of creating an action form with an inline, whose fields are prepared once per form class and fieldsets.
+"""
+
+from . import report, setup
+
+setup()
+
+from django import forms
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+
+from django_admin_action_forms import (
+    AdminActionForm,
+    InlineAdminActionForm,
+    TabularAdminActionInline,
+)
+from tests.models import Category, Product
+
+
+class LineForm(InlineAdminActionForm):
+    category = forms.ModelChoiceField(queryset=Category.objects.all())
+    quantity = forms.IntegerField()
+    note = forms.CharField(required=False)
+
+    class Meta:
+        autocomplete_fields = ["category"]
+
+
+class Lines(TabularAdminActionInline):
+    name = "lines"
+    form = LineForm
+
+
+class BenchmarkForm(AdminActionForm):
+    price = forms.IntegerField()
+    date = forms.DateField()
+    category = forms.ModelChoiceField(queryset=Category.objects.all())
+    description = forms.CharField(widget=forms.Textarea, required=False)
+
+    class Meta:
+        autocomplete_fields = ["category"]
+        inlines = [Lines]
+
+
+def main() -> None:
+    modeladmin = admin.site._registry[Product]
+    request = RequestFactory().post("/")
+    request.user = User(is_active=True, is_staff=True, is_superuser=True)
+    queryset = Product.objects.all()
+
+    def construct():
+        form = BenchmarkForm(modeladmin, "benchmark", request, queryset)
+        # Inlines are created lazily, together with their empty forms
+        for inline in form.inlines:
+            inline.empty_form
+
+    report("Form with one inline", construct, number=2000)
+
+
+if __name__ == "__main__":
+    main()
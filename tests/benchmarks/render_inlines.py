@@ -0,0 +1,87 @@
+"""
+Time of rendering an action form page with many inlines, with and without `Meta.cache_rendered_fields`.
+"""
+
+from . import report, setup
+
+setup()
+
+from django import forms
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory
+
+from django_admin_action_forms import (
+    AdminActionForm,
+    InlineAdminActionForm,
+    TabularAdminActionInline,
+)
+from tests.models import Product
+
+INLINES = 8
+EXTRA = 3
+
+
+def get_form_class(cache_rendered_fields: bool) -> "type[AdminActionForm]":
+    class LineForm(InlineAdminActionForm):
+        name = forms.CharField()
+        quantity = forms.IntegerField()
+        price = forms.DecimalField()
+        date = forms.DateField()
+        kind = forms.ChoiceField(choices=[(i, f"Kind {i}") for i in range(20)])
+        note = forms.CharField(widget=forms.Textarea, required=False)
+
+        class Meta:
+            pass
+
+    LineForm.Meta.cache_rendered_fields = cache_rendered_fields
+
+    inlines = [
+        type(
+            f"Lines{i}",
+            (TabularAdminActionInline,),
+            {"name": f"lines_{i}", "form": LineForm, "extra": EXTRA},
+        )
+        for i in range(INLINES)
+    ]
+
+    class BenchmarkForm(AdminActionForm):
+        price = forms.IntegerField()
+        date = forms.DateField()
+
+        class Meta:
+            pass
+
+    BenchmarkForm.Meta.inlines = inlines
+    BenchmarkForm.Meta.cache_rendered_fields = cache_rendered_fields
+
+    return BenchmarkForm
+
+
+def main() -> None:
+    modeladmin = admin.site._registry[Product]
+    queryset = Product.objects.none()
+
+    request = RequestFactory().post("/admin/tests/product/")
+    request.user = User(is_active=True, is_staff=True, is_superuser=True)
+    request.session = {}
+    request._messages = FallbackStorage(request)
+
+    for cache_rendered_fields in [False, True]:
+        form_class = get_form_class(cache_rendered_fields)
+
+        def render():
+            # Page is rendered for an action registered in tests.admin, using the benchmarked form
+            form = form_class(modeladmin, "add_note", request, queryset)
+            form.action_form_view(request).render()
+
+        report(
+            f"{INLINES} inlines with {EXTRA} rows, cache_rendered_fields={cache_rendered_fields}",
+            render,
+            number=20,
+        )
+
+
+if __name__ == "__main__":
+    main()
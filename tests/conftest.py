@@ -0,0 +1,24 @@
+import os
+
+import django
+import pytest
+
+
+def pytest_configure(config):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+    django.setup()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_environment():
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    old_config = runner.setup_databases()
+
+    yield
+
+    runner.teardown_databases(old_config)
+    teardown_test_environment()
@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=50)
+
+    def __str__(self):
+        return self.name
+
+
+class Product(models.Model):
+    name = models.CharField(max_length=50)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    price = models.IntegerField(default=0)
+    created_at = models.DateTimeField()
+
+    def __str__(self):
+        return self.name
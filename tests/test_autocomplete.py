@@ -0,0 +1,76 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from django_admin_action_forms.autocomplete import (
+    filter_after_cursor,
+    get_cursor,
+    get_keyset_ordering,
+    order_by_keyset,
+)
+
+from .models import Category, Product
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name="Category")
+        created_at = timezone.make_aware(datetime.datetime(2024, 1, 1, 12, 0, 0))
+
+        # Microseconds differ, while milliseconds are the same
+        for microsecond in (1, 2, 3, 5, 8, 13, 21, 34, 55, 89):
+            Product.objects.create(
+                name=f"Product {microsecond}",
+                category=category,
+                created_at=created_at.replace(microsecond=microsecond),
+            )
+
+    def paginate(self, queryset, page_size=3):
+        ordering = get_keyset_ordering(queryset)
+        queryset = order_by_keyset(queryset, ordering)
+
+        pages = []
+        cursor = None
+
+        # Repeated objects would otherwise make the pagination never end
+        for _ in range(queryset.count() + 1):
+            page_queryset = queryset
+            if cursor is not None:
+                page_queryset = filter_after_cursor(queryset, ordering, cursor)
+
+            page = list(page_queryset[:page_size])
+            if not page:
+                return pages
+
+            pages.append(page)
+            cursor = get_cursor(page[-1], ordering)
+
+        self.fail("Pagination did not end after all objects were returned.")
+
+    def test_pages_over_objects_differing_only_in_microseconds(self):
+        queryset = Product.objects.order_by("created_at")
+
+        objects = [obj for page in self.paginate(queryset) for obj in page]
+
+        self.assertEqual(objects, list(queryset.order_by("created_at", "pk")))
+
+    def test_pages_over_objects_differing_only_in_microseconds_descending(self):
+        queryset = Product.objects.order_by("-created_at")
+
+        objects = [obj for page in self.paginate(queryset) for obj in page]
+
+        self.assertEqual(objects, list(queryset.order_by("-created_at", "pk")))
+
+    def test_cursor_keeps_microseconds(self):
+        obj = Product.objects.get(name="Product 55")
+        ordering = get_keyset_ordering(Product.objects.order_by("created_at"))
+
+        following = filter_after_cursor(
+            order_by_keyset(Product.objects.all(), ordering),
+            ordering,
+            get_cursor(obj, ordering),
+        )
+
+        self.assertEqual([product.name for product in following], ["Product 89"])
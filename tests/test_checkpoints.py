@@ -0,0 +1,68 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import RequestFactory, TransactionTestCase
+from django.utils import timezone
+
+from django_admin_action_forms.checkpoints import Checkpoint
+
+from .admin import ProductAdmin
+from .models import Category, Product
+
+
+class CacheCheckpointStoreTests(TransactionTestCase):
+    def setUp(self):
+        category = Category.objects.create(name="Category")
+        self.products = [
+            Product.objects.create(
+                name=name, category=category, created_at=timezone.now()
+            )
+            for name in ["Product 1", "Product 2", "Product 3", "Product 4", "Broken"]
+        ]
+
+        self.modeladmin = admin.site._registry[Product]
+        self.action = ProductAdmin.set_price_in_chunks
+        self.request = RequestFactory().post("/")
+        self.request.user = User.objects.create_superuser("root")
+
+        self.checkpoint = Checkpoint.from_request(
+            self.modeladmin, "set_price_in_chunks", self.request
+        )
+        self.action.checkpoint_store.save(self.checkpoint)
+
+    def call_action(self):
+        self.action.call_action(
+            self.modeladmin,
+            self.request,
+            "set_price_in_chunks",
+            (Product.objects.all(),),
+            {"price": 10},
+            self.checkpoint,
+        )
+
+    def test_checkpoint_is_saved_after_chunk_is_committed(self):
+        with self.assertRaises(RuntimeError):
+            self.call_action()
+
+        checkpoint = self.action.checkpoint_store.get(self.checkpoint.id)
+
+        self.assertEqual(checkpoint.last_pk, self.products[3].pk)
+        self.assertEqual(checkpoint.processed, 4)
+
+    def test_checkpoint_is_not_saved_when_chunks_are_rolled_back(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.call_action()
+
+        checkpoint = self.action.checkpoint_store.get(self.checkpoint.id)
+
+        self.assertIsNone(checkpoint.last_pk)
+        self.assertEqual(checkpoint.processed, 0)
+        self.assertFalse(Product.objects.filter(price=10).exists())
+
+    def test_checkpoint_is_deleted_after_outer_transaction_is_committed(self):
+        Product.objects.filter(name="Broken").delete()
+
+        with transaction.atomic():
+            self.call_action()
+
+        self.assertIsNone(self.action.checkpoint_store.get(self.checkpoint.id))
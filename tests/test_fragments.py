@@ -0,0 +1,51 @@
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Category, Product
+
+
+class RenderedFieldsCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser("root", password="password")
+        cls.staff = User.objects.create_user(
+            "staff", password="password", is_staff=True
+        )
+        cls.staff.user_permissions.add(
+            *Permission.objects.filter(codename__in=["view_product", "change_product"])
+        )
+
+        category = Category.objects.create(name="Category")
+        cls.product = Product.objects.create(
+            name="Product", category=category, created_at=timezone.now()
+        )
+
+    def render_action_form(self, user, action):
+        self.client.force_login(user)
+        return self.client.post(
+            reverse("admin:tests_product_changelist"),
+            {
+                "action": action,
+                ACTION_CHECKBOX_NAME: [self.product.pk],
+                "submitted_from_changelist_view": "1",
+            },
+        )
+
+    def test_fields_are_not_cached_by_default(self):
+        superuser_response = self.render_action_form(self.superuser, "add_note")
+        staff_response = self.render_action_form(self.staff, "add_note")
+
+        self.assertContains(superuser_response, "secret-of-root")
+        self.assertEqual(staff_response.status_code, 200)
+        self.assertNotContains(staff_response, "secret-of-root")
+
+    def test_cached_fields_depend_on_permissions_of_user(self):
+        superuser_response = self.render_action_form(self.superuser, "add_cached_note")
+        staff_response = self.render_action_form(self.staff, "add_cached_note")
+
+        self.assertContains(superuser_response, "Superuser note")
+        self.assertEqual(staff_response.status_code, 200)
+        self.assertNotContains(staff_response, "Superuser note")
@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+
+from django_admin_action_forms import action_with_form
+from django_admin_action_forms.locks import (
+    CacheLockBackend,
+    DatabaseAdvisoryLockBackend,
+    FileLockBackend,
+)
+
+from .admin import PriceForm
+
+
+class BackgroundLockBackendTests(SimpleTestCase):
+    def test_process_bound_backends_cannot_be_used_in_background(self):
+        for lock_backend in [DatabaseAdvisoryLockBackend(), FileLockBackend()]:
+            with self.subTest(lock_backend=lock_backend), self.assertRaisesMessage(
+                ValueError,
+                f"{lock_backend.__class__.__name__} cannot be used together with background.",
+            ):
+                action_with_form(
+                    PriceForm,
+                    background=True,
+                    max_concurrent=1,
+                    lock_backend=lock_backend,
+                )
+
+    def test_cache_backend_can_be_used_in_background(self):
+        action_with_form(
+            PriceForm,
+            background=True,
+            max_concurrent=1,
+            lock_backend=CacheLockBackend(),
+        )
@@ -0,0 +1,67 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TransactionTestCase
+from django.utils import timezone
+
+from django_admin_action_forms.tasks import MessagesCollector
+
+from .admin import ProductAdmin
+from .models import Category, Product
+
+
+class RunInProcessesTests(TransactionTestCase):
+    """
+    Workers open their own connections, so the test database is stored in a file, see `settings.DATABASES`.
+    """
+
+    def setUp(self):
+        self.category = Category.objects.create(name="Category")
+
+        self.modeladmin = admin.site._registry[Product]
+        self.request = RequestFactory().post("/")
+        self.request.user = User.objects.create_superuser("root")
+        self.request._messages = MessagesCollector()
+
+    def create_products(self, *names):
+        for name in names:
+            Product.objects.create(
+                name=name, category=self.category, created_at=timezone.now()
+            )
+
+    def call_action(self):
+        ProductAdmin.increase_price_in_processes.call_action(
+            self.modeladmin,
+            self.request,
+            "increase_price_in_processes",
+            (Product.objects.all(),),
+            {"price": 1},
+        )
+
+        return [str(message) for message in self.request._messages]
+
+    def test_every_object_is_processed_once(self):
+        self.create_products(*(f"Product {i}" for i in range(7)))
+
+        messages = self.call_action()
+
+        self.assertEqual(list(Product.objects.values_list("price", flat=True)), [1] * 7)
+        self.assertEqual(messages, ["Prices increased."])
+
+    def test_errors_of_workers_are_collected(self):
+        self.create_products("Product 1", "Product 2", "Broken", "Product 4")
+        broken = Product.objects.get(name="Broken")
+
+        messages = self.call_action()
+
+        # Part containing the broken product was rolled back
+        self.assertEqual(
+            dict(Product.objects.values_list("name", "price")),
+            {"Product 1": 1, "Product 2": 1, "Broken": 0, "Product 4": 0},
+        )
+        self.assertEqual(
+            messages,
+            [
+                "Prices increased.",
+                f"1 of 2 parts failed: {broken.pk}-{broken.pk + 1}: Broken product",
+            ],
+        )
@@ -0,0 +1,108 @@
+from django.contrib import admin
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import RequestFactory, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .admin import ReplicaPriceForm
+from .models import Category, Product
+
+
+class ReadDatabaseTests(TransactionTestCase):
+    """
+    Replica mirrors the default database, and the router sends all queries to the default one.
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.superuser = User.objects.create_superuser("root", password="password")
+        self.category = Category.objects.create(name="Category")
+        self.product = Product.objects.create(
+            name="Product", category=self.category, created_at=timezone.now()
+        )
+
+        self.modeladmin = admin.site._registry[Product]
+        self.request = RequestFactory().post("/")
+        self.request.user = self.superuser
+
+    def capture_queries(self):
+        return (
+            CaptureQueriesContext(connections["default"]),
+            CaptureQueriesContext(connections["replica"]),
+        )
+
+    @staticmethod
+    def get_tables(queries):
+        return {
+            table
+            for table in ["tests_product", "tests_category"]
+            for query in queries
+            if table in query["sql"]
+        }
+
+    def test_form_is_rendered_using_read_database(self):
+        form = ReplicaPriceForm(
+            self.modeladmin,
+            "set_price_using_replica",
+            self.request,
+            Product.objects.all(),
+        )
+        default, replica = self.capture_queries()
+
+        with default, replica:
+            objects, _ = form.get_list_objects_page()
+            count = form.get_objects_count()
+            choices = list(form.fields["category"].choices)
+
+        self.assertEqual(objects, [self.product])
+        self.assertEqual(count.value, 1)
+        self.assertEqual(len(choices), 2)
+        self.assertEqual(len(default), 0)
+        self.assertEqual(self.get_tables(replica), {"tests_product", "tests_category"})
+
+    def test_autocomplete_uses_read_database(self):
+        self.client.force_login(self.superuser)
+        default, replica = self.capture_queries()
+
+        with default, replica:
+            response = self.client.get(
+                reverse("admin:tests_product_action_form_autocomplete"),
+                {
+                    "action_name": "set_price_using_replica",
+                    "field_name": "similar_to",
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["id"] for result in response.json()["results"]],
+            [str(self.category.pk)],
+        )
+        self.assertEqual(self.get_tables(default), set())
+        self.assertEqual(self.get_tables(replica), {"tests_category"})
+
+    def test_submitted_form_uses_default_database(self):
+        self.client.force_login(self.superuser)
+        default, replica = self.capture_queries()
+
+        with default, replica:
+            response = self.client.post(
+                reverse("admin:tests_product_changelist"),
+                {
+                    "action": "set_price_using_replica",
+                    ACTION_CHECKBOX_NAME: [self.product.pk],
+                    "price": 10,
+                    "category": self.category.pk,
+                },
+                follow=True,
+            )
+
+        self.assertEqual(
+            [str(message) for message in response.context["messages"]],
+            ["Queryset default, category default."],
+        )
+        self.assertEqual(len(replica), 0)
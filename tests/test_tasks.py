@@ -0,0 +1,76 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.signals import request_finished, request_started
+from django.db import transaction
+from django.test import RequestFactory, TransactionTestCase
+
+from django_admin_action_forms.tasks import ActionTask
+
+from .admin import ProductAdmin
+from .models import Product
+
+
+class BackgroundTaskSubmissionTests(TransactionTestCase):
+    def setUp(self):
+        self.modeladmin = admin.site._registry[Product]
+        self.action = ProductAdmin.set_price_in_background
+        self.action.executor.tasks.clear()
+
+        self.request = RequestFactory().post("/", {"price": 10})
+        self.request.user = User.objects.create_superuser("root")
+
+    def start_action(self):
+        queryset = Product.objects.all()
+        lock = self.action.acquire_slot(self.modeladmin, "set_price_in_background")
+        self.assertIsNotNone(lock)
+
+        response = self.action.start_action(
+            self.modeladmin,
+            self.request,
+            "set_price_in_background",
+            queryset,
+            (queryset,),
+            {"price": 10},
+            lock=lock,
+        )
+        return response.url.rstrip("/").rsplit("/", 1)[-1]
+
+    def assertSlotReleased(self):
+        lock = self.action.acquire_slot(self.modeladmin, "set_price_in_background")
+        self.assertIsNotNone(lock)
+        self.action.lock_backend.release(lock)
+
+    def test_task_is_submitted_after_commit(self):
+        request_started.send(sender=self.__class__)
+        with transaction.atomic():
+            task_id = self.start_action()
+            self.assertEqual(self.action.executor.tasks, [])
+        request_finished.send(sender=self.__class__)
+
+        self.assertEqual([task.id for task in self.action.executor.tasks], [task_id])
+        self.assertEqual(ActionTask.get(task_id).status, ActionTask.PENDING)
+
+        self.action.executor.tasks[0].release_lock()
+
+    def test_task_is_failed_when_request_is_rolled_back(self):
+        request_started.send(sender=self.__class__)
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            task_id = self.start_action()
+            raise RuntimeError
+        request_finished.send(sender=self.__class__)
+
+        self.assertEqual(self.action.executor.tasks, [])
+        self.assertEqual(ActionTask.get(task_id).status, ActionTask.FAILED)
+        self.assertSlotReleased()
+
+    def test_task_is_not_tracked_outside_of_requests(self):
+        receivers = len(request_finished.receivers)
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            task_id = self.start_action()
+            raise RuntimeError
+
+        self.assertEqual(len(request_finished.receivers), receivers)
+        self.assertEqual(ActionTask.get(task_id).status, ActionTask.PENDING)
+
+        ActionTask.get(task_id).release_lock()